@@ -166,18 +166,18 @@ def test_structural_agent():
     results = agent.analyze_structure(spec, building_use="residential")
 
     print(f"\n  Building Info:")
-    print(f"    Floors: {results['building_info']['total_floors']}")
-    print(f"    Height: {results['building_info']['building_height']:.1f} m")
+    print(f"    Floors: {results.building_info.total_floors}")
+    print(f"    Height: {results.building_info.building_height:.1f} m")
 
     print(f"\n  Loads:")
-    loads = results['load_analysis']
-    print(f"    Total dead load: {loads['total_dead_load']:.1f} kN")
-    print(f"    Total live load: {loads['total_live_load']:.1f} kN")
+    loads = results.load_analysis
+    print(f"    Total dead load: {loads.total_dead_load:.1f} kN")
+    print(f"    Total live load: {loads.total_live_load:.1f} kN")
 
     print(f"\n  Column Design:")
-    col = results['column_design']
-    print(f"    Column size: {col['column_size']}")
-    print(f"    Column count: {results['structural_grid']['column_count']}")
+    col = results.column_design
+    print(f"    Column size: {col.column_size}")
+    print(f"    Column count: {results.structural_grid.column_count}")
 
     return True
 
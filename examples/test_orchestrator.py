@@ -62,15 +62,15 @@ def test_basic_workflow():
         response = orchestrator.process_message(user_request, auto_execute=False)
 
         print("\nResponse:")
-        print(f"Status: {response['status']}")
-        print(f"Action: {response['action']}")
-        print(f"Message: {response['message']}")
+        print(f"Status: {response.status}")
+        print(f"Action: {response.action}")
+        print(f"Message: {response.message}")
 
-        if response['status'] == 'success':
-            print(f"\nDesign spec saved to: {response.get('spec_file')}")
+        if response.status == 'success':
+            print(f"\nDesign spec saved to: {response.spec_file}")
 
             # Display summary
-            spec = response.get('design_spec')
+            spec = response.design_spec
             if spec:
                 print("\nDesign Summary:")
                 print(f"  Project: {spec['project_info']['name']}")
@@ -86,12 +86,12 @@ def test_basic_workflow():
             print("=" * 60)
 
             exec_response = orchestrator.execute_design()
-            print(f"\nExecution Status: {exec_response['status']}")
-            print(f"Message: {exec_response['message']}")
+            print(f"\nExecution Status: {exec_response.status}")
+            print(f"Message: {exec_response.message}")
 
-            if exec_response['status'] == 'success':
+            if exec_response.status == 'success':
                 print("\nGenerated Files:")
-                for output_file in exec_response.get('output_files', []):
+                for output_file in exec_response.output_files or []:
                     print(f"  - {output_file}")
 
     except ValueError as e:
@@ -112,6 +112,7 @@ def test_basic_workflow():
     print("\n" + "=" * 60)
     print("Saving session...")
     orchestrator.save_session()
+    orchestrator.close()
     print("Session saved!")
 
 
@@ -145,12 +146,12 @@ def test_with_example_spec(orchestrator: OrchestratorAgent):
     print("=" * 60)
 
     exec_response = orchestrator.execute_design()
-    print(f"\nExecution Status: {exec_response['status']}")
-    print(f"Message: {exec_response['message']}")
+    print(f"\nExecution Status: {exec_response.status}")
+    print(f"Message: {exec_response.message}")
 
-    if exec_response['status'] == 'success':
+    if exec_response.status == 'success':
         print("\nGenerated Files:")
-        for output_file in exec_response.get('output_files', []):
+        for output_file in exec_response.output_files or []:
             print(f"  - {output_file}")
 
         print("\n✅ Test completed successfully!")
@@ -5,13 +5,13 @@ Implementation agent responsible for generating AutoCAD DXF/DWG files.
 
 import logging
 from pathlib import Path
-from typing import Optional
-import json
+from typing import Any, Dict, List, Optional
 
 from ..models.design_spec import DesignSpec
 from ..skills.dxf_generator import DXFGenerator
 from ..skills.schema_validator import DesignSpecValidator
-from ..skills.geometry_engine import GeometryEngine
+from ..skills.geometry_engine import get_default_engine
+from ..utils.json_io import read_json
 
 
 class AutoCADAgent:
@@ -23,7 +23,9 @@ class AutoCADAgent:
     def __init__(
         self,
         wall_thickness: float = 0.2,
-        schema_path: Optional[Path] = None
+        schema_path: Optional[Path] = None,
+        schema: Optional[Dict[str, Any]] = None,
+        validator: Optional[DesignSpecValidator] = None
     ):
         """
         Initialize AutoCAD Agent.
@@ -31,15 +33,17 @@ class AutoCADAgent:
         Args:
             wall_thickness: Default wall thickness in meters
             schema_path: Path to JSON schema file for validation
+            schema: Already-parsed schema (skips reading schema_path)
+            validator: Already-built validator to share (skips schema and schema_path)
         """
         self.logger = logging.getLogger(__name__)
         self.dxf_generator = DXFGenerator(wall_thickness=wall_thickness)
-        self.geometry_engine = GeometryEngine()
+        self.geometry_engine = get_default_engine()
 
         # Initialize validator if schema path provided
-        self.validator = None
-        if schema_path and schema_path.exists():
-            self.validator = DesignSpecValidator(schema_path)
+        self.validator = validator
+        if validator is None and (schema is not None or (schema_path and schema_path.exists())):
+            self.validator = DesignSpecValidator(schema_path, schema=schema)
 
     def create_floor_plan(
         self,
@@ -76,8 +80,10 @@ class AutoCADAgent:
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Generate DXF
+        # Generate DXF into a fresh document, so a reused agent never carries
+        # entities from a previous floor or spec into this file
         try:
+            self.dxf_generator.create_new_document()
             result_path = self.dxf_generator.generate_from_spec(
                 spec=spec,
                 output_path=output_path,
@@ -91,6 +97,49 @@ class AutoCADAgent:
             self.logger.error(f"Error generating floor plan: {str(e)}")
             raise
 
+    def create_floor_plans(
+        self,
+        spec: DesignSpec,
+        floor_levels: List[int],
+        output_dir: Path,
+        validate: bool = True
+    ) -> List[Path]:
+        """
+        Create floor plan DXF files for several floors in one call.
+
+        The specification is validated once for all floors, and each floor
+        is written to ``floor_{level}.dxf`` in output_dir.
+
+        Args:
+            spec: Design specification
+            floor_levels: Floor levels to generate
+            output_dir: Output directory for the DXF files
+            validate: Whether to validate specification before generation
+
+        Returns:
+            Paths to generated DXF files, in floor_levels order
+
+        Raises:
+            ValueError: If validation fails or a floor is not found
+        """
+        if validate and self.validator:
+            is_valid, errors = self.validator.full_validation(spec)
+            if not is_valid:
+                error_msg = "Specification validation failed:\n" + "\n".join(errors)
+                self.logger.error(error_msg)
+                raise ValueError(error_msg)
+
+        output_dir = Path(output_dir)
+        return [
+            self.create_floor_plan(
+                spec=spec,
+                output_path=output_dir / f"floor_{level}.dxf",
+                floor_level=level,
+                validate=False
+            )
+            for level in floor_levels
+        ]
+
     def create_floor_plan_from_json(
         self,
         json_path: Path,
@@ -111,8 +160,7 @@ class AutoCADAgent:
         self.logger.info(f"Loading specification from {json_path}")
 
         # Load JSON
-        with open(json_path, 'r', encoding='utf-8') as f:
-            spec_dict = json.load(f)
+        spec_dict = read_json(Path(json_path))
 
         # Parse into Pydantic model
         spec = DesignSpec(**spec_dict)
@@ -191,11 +239,8 @@ class AutoCADAgent:
         Returns:
             Dictionary with analysis statistics
         """
-        import json
-
         # Load JSON
-        with open(json_path, 'r', encoding='utf-8') as f:
-            spec_dict = json.load(f)
+        spec_dict = read_json(Path(json_path))
 
         # Convert to DesignSpec
         spec = DesignSpec(**spec_dict)
@@ -11,11 +11,11 @@ Verifies compliance with Korean building regulations including:
 
 from typing import Dict, Any, Optional, List
 from pathlib import Path
-import json
 
 from ..models.design_spec import DesignSpec, RoomType
 from ..skills.schema_validator import DesignSpecValidator as SchemaValidator
-from ..skills.geometry_engine import GeometryEngine
+from ..skills.geometry_engine import get_default_engine
+from ..utils.json_io import write_json
 
 
 class ComplianceAgent:
@@ -39,7 +39,7 @@ class ComplianceAgent:
         """
         self.schema_path = Path(schema_path)
         self.validator = SchemaValidator(schema_path)
-        self.geometry_engine = GeometryEngine()
+        self.geometry_engine = get_default_engine()
 
     def check_compliance(
         self,
@@ -477,8 +477,7 @@ class ComplianceAgent:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(compliance_results, f, indent=2, ensure_ascii=False)
+        write_json(output_path, compliance_results)
 
     def generate_summary_report(
         self,
@@ -10,12 +10,12 @@ Performs MEP analysis including:
 
 from typing import Dict, Any, Optional, List
 from pathlib import Path
-import json
 import math
 
 from ..models.design_spec import DesignSpec, Room, RoomType
 from ..skills.schema_validator import DesignSpecValidator as SchemaValidator
-from ..skills.geometry_engine import GeometryEngine
+from ..skills.geometry_engine import get_default_engine
+from ..utils.json_io import write_json
 
 
 class MEPAgent:
@@ -40,7 +40,7 @@ class MEPAgent:
         """
         self.schema_path = Path(schema_path)
         self.validator = SchemaValidator(schema_path)
-        self.geometry_engine = GeometryEngine()
+        self.geometry_engine = get_default_engine()
 
     def analyze_mep_systems(
         self,
@@ -507,8 +507,7 @@ class MEPAgent:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(analysis_results, f, indent=2, ensure_ascii=False)
+        write_json(output_path, analysis_results)
 
     def get_capabilities(self) -> Dict[str, Any]:
         """
@@ -7,7 +7,6 @@ IFC is the international standard for BIM data exchange.
 
 from typing import Dict, Any, Optional, List
 from pathlib import Path
-import json
 
 try:
     import ifcopenshell
@@ -21,7 +20,8 @@ except ImportError:
 
 from ..models.design_spec import DesignSpec, Room, Door, Window
 from ..skills.schema_validator import DesignSpecValidator as SchemaValidator
-from ..skills.geometry_engine import GeometryEngine
+from ..skills.geometry_engine import get_default_engine
+from ..utils.json_io import read_json
 
 
 class RevitAgent:
@@ -53,7 +53,7 @@ class RevitAgent:
 
         self.schema_path = Path(schema_path)
         self.validator = SchemaValidator(schema_path)
-        self.geometry_engine = GeometryEngine()
+        self.geometry_engine = get_default_engine()
 
         # IFC model
         self.ifc_file = None
@@ -233,8 +233,7 @@ class RevitAgent:
             ifc_schema: IFC schema version
         """
         # Load and validate JSON
-        with open(json_path, 'r', encoding='utf-8') as f:
-            spec_dict = json.load(f)
+        spec_dict = read_json(Path(json_path))
 
         validation_result = self.validator.validate_all(spec_dict)
         if not validation_result['valid']:
@@ -6,7 +6,6 @@ Generates Rhino3D (.3dm) files from DesignSpec JSON using rhino3dm library.
 
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
-import json
 import math
 
 try:
@@ -17,7 +16,8 @@ except ImportError:
 
 from ..models.design_spec import DesignSpec, Room, Door, Window, Furniture
 from ..skills.schema_validator import DesignSpecValidator as SchemaValidator
-from ..skills.geometry_engine import GeometryEngine
+from ..skills.geometry_engine import get_default_engine
+from ..utils.json_io import read_json
 
 
 class RhinoAgent:
@@ -49,7 +49,7 @@ class RhinoAgent:
 
         self.schema_path = Path(schema_path)
         self.validator = SchemaValidator(schema_path)
-        self.geometry_engine = GeometryEngine()
+        self.geometry_engine = get_default_engine()
 
         # Rhino model
         self.model = None
@@ -197,7 +197,7 @@ class RhinoAgent:
         # Calculate wall direction and perpendicular
         dx = end_point[0] - start_point[0]
         dy = end_point[1] - start_point[1]
-        length = math.sqrt(dx * dx + dy * dy)
+        length = math.hypot(dx, dy)
 
         if length == 0:
             return
@@ -271,7 +271,7 @@ class RhinoAgent:
         """Create a simple wall box."""
         dx = end[0] - start[0]
         dy = end[1] - start[1]
-        length = math.sqrt(dx * dx + dy * dy)
+        length = math.hypot(dx, dy)
 
         if length == 0:
             return None
@@ -343,8 +343,7 @@ class RhinoAgent:
             extrude_height: Default extrusion height
         """
         # Load and validate JSON
-        with open(json_path, 'r', encoding='utf-8') as f:
-            spec_dict = json.load(f)
+        spec_dict = read_json(Path(json_path))
 
         validation_result = self.validator.validate_all(spec_dict)
         if not validation_result['valid']:
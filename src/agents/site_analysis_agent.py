@@ -11,13 +11,13 @@ Performs site analysis including:
 
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
-import json
 import math
 from datetime import datetime, timedelta
 
 from ..models.design_spec import DesignSpec
 from ..skills.schema_validator import DesignSpecValidator as SchemaValidator
-from ..skills.geometry_engine import GeometryEngine
+from ..skills.geometry_engine import get_default_engine
+from ..utils.json_io import write_json
 
 
 class SiteAnalysisAgent:
@@ -42,7 +42,7 @@ class SiteAnalysisAgent:
         """
         self.schema_path = Path(schema_path)
         self.validator = SchemaValidator(schema_path)
-        self.geometry_engine = GeometryEngine()
+        self.geometry_engine = get_default_engine()
 
     def analyze_site(
         self,
@@ -394,8 +394,7 @@ class SiteAnalysisAgent:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(analysis_results, f, indent=2, ensure_ascii=False)
+        write_json(output_path, analysis_results)
 
     def get_capabilities(self) -> Dict[str, Any]:
         """
@@ -8,14 +8,158 @@ Performs structural analysis including:
 - Structural member layout
 """
 
-from typing import Dict, Any, Optional, List, Tuple
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple
 from pathlib import Path
-import json
+from dataclasses import dataclass, asdict
+from functools import cached_property
 import math
+from types import MappingProxyType
+
+import numpy as np
 
 from ..models.design_spec import DesignSpec, Floor, Room
 from ..skills.schema_validator import DesignSpecValidator as SchemaValidator
-from ..skills.geometry_engine import GeometryEngine
+
+if TYPE_CHECKING:
+    from ..skills.geometry_engine import GeometryEngine
+
+
+# Live load per Korean Building Code (kN/m²)
+_LIVE_LOADS_KN_M2 = MappingProxyType({
+    'residential': 2.0,  # 주거용
+    'office': 2.5,       # 사무실
+    'retail': 4.0,       # 상업용
+    'storage': 5.0,      # 창고
+    'parking': 2.5       # 주차장
+})
+
+
+def _grid_letter(index: int) -> str:
+    """Convert a 0-based grid index to a letter label (A..Z, AA, AB, ...)."""
+    label = ''
+    index += 1
+    while index > 0:
+        index, rem = divmod(index - 1, 26)
+        label = chr(65 + rem) + label
+    return label
+
+
+@dataclass(slots=True, frozen=True)
+class BuildingInfo:
+    """Basic building information."""
+    total_floors: int
+    building_height: float
+    total_floor_area: float
+    typical_floor_height: float
+
+
+@dataclass(slots=True, frozen=True)
+class FloorLoad:
+    """Loads on a single floor."""
+    floor_level: int
+    floor_area: float
+    dead_load_per_area: float
+    live_load_per_area: float
+    total_dead_load: float
+    total_live_load: float
+    factored_load: float
+
+
+@dataclass(slots=True, frozen=True)
+class LoadAnalysis:
+    """Building load analysis (kN, kN/m²)."""
+    building_use: str
+    live_load_intensity: float
+    dead_load_intensity: float
+    loads_by_floor: Tuple[FloorLoad, ...]
+    total_dead_load: float
+    total_live_load: float
+    total_factored_load: float
+
+
+@dataclass(slots=True, frozen=True)
+class GridColumn:
+    """Column at a structural grid intersection."""
+    id: str
+    position: Tuple[float, float]
+    grid_ref: str
+
+
+@dataclass(slots=True, frozen=True)
+class StructuralGrid:
+    """Structural grid (column layout)."""
+    grid_spacing: Optional[float] = None
+    x_grid_lines: Tuple[float, ...] = ()
+    y_grid_lines: Tuple[float, ...] = ()
+    column_count: int = 0
+    columns: Tuple[GridColumn, ...] = ()
+
+
+@dataclass(slots=True, frozen=True)
+class ColumnDesign:
+    """Preliminary RC column design."""
+    design_method: Optional[str] = None
+    load_per_column: Optional[float] = None
+    required_area: Optional[float] = None
+    column_size: Optional[str] = None
+    concrete_strength: Optional[float] = None
+    steel_grade: Optional[str] = None
+    columns: Tuple[GridColumn, ...] = ()
+
+
+@dataclass(slots=True, frozen=True)
+class BeamDesign:
+    """Preliminary RC beam design."""
+    typical_span: float
+    beam_size: str
+    beam_width: int
+    beam_depth: int
+    design_note: str
+
+
+@dataclass(slots=True, frozen=True)
+class FoundationDesign:
+    """Preliminary spread footing design."""
+    foundation_type: Optional[str] = None
+    soil_bearing_capacity: Optional[float] = None
+    load_per_footing: Optional[float] = None
+    required_area: Optional[float] = None
+    footing_size: Optional[str] = None
+    footing_thickness: Optional[float] = None
+    design_note: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class ComplianceCheck:
+    """Single building code check."""
+    check: str
+    value: Any
+    requirement: str
+    status: str
+
+
+@dataclass(slots=True, frozen=True)
+class StructuralCompliance:
+    """Building code compliance summary."""
+    checks: Tuple[ComplianceCheck, ...]
+    overall_status: str
+    note: str
+
+
+@dataclass(slots=True, frozen=True)
+class StructuralAnalysis:
+    """Complete structural analysis result returned by analyze_structure()."""
+    building_info: BuildingInfo
+    load_analysis: LoadAnalysis
+    structural_grid: StructuralGrid
+    column_design: ColumnDesign
+    beam_design: BeamDesign
+    foundation: FoundationDesign
+    compliance: StructuralCompliance
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the analysis to nested dictionaries."""
+        return asdict(self)
 
 
 class StructuralAgent:
@@ -40,7 +184,6 @@ class StructuralAgent:
         """
         self.schema_path = Path(schema_path)
         self.validator = SchemaValidator(schema_path)
-        self.geometry_engine = GeometryEngine()
 
         # Material properties (default: concrete)
         self.concrete_density = 2400  # kg/m³
@@ -51,11 +194,17 @@ class StructuralAgent:
         self.dead_load_factor = 1.2
         self.live_load_factor = 1.6
 
+    @cached_property
+    def geometry_engine(self) -> 'GeometryEngine':
+        """Shared geometry engine, imported on first use (pulls in shapely)."""
+        from ..skills.geometry_engine import get_default_engine
+        return get_default_engine()
+
     def analyze_structure(
         self,
         spec: DesignSpec,
         building_use: str = "residential"
-    ) -> Dict[str, Any]:
+    ) -> StructuralAnalysis:
         """
         Perform comprehensive structural analysis.
 
@@ -64,46 +213,56 @@ class StructuralAgent:
             building_use: Building use type (residential, office, retail, etc.)
 
         Returns:
-            Dictionary with structural analysis results
+            Structural analysis results
         """
-        results = {
-            'building_info': self._get_building_info(spec),
-            'load_analysis': self._calculate_loads(spec, building_use),
-            'structural_grid': self._generate_structural_grid(spec),
-            'column_design': self._design_columns(spec, building_use),
-            'beam_design': self._design_beams(spec),
-            'foundation': self._design_foundation(spec, building_use),
-            'compliance': self._check_structural_compliance(spec)
-        }
-
-        return results
+        return StructuralAnalysis(
+            building_info=self._get_building_info(spec),
+            load_analysis=self._calculate_loads(spec, building_use),
+            structural_grid=self._generate_structural_grid(spec),
+            column_design=self._design_columns(spec, building_use),
+            beam_design=self._design_beams(spec),
+            foundation=self._design_foundation(spec, building_use),
+            compliance=self._check_structural_compliance(spec)
+        )
 
-    def _get_building_info(self, spec: DesignSpec) -> Dict[str, Any]:
+    def _get_building_info(self, spec: DesignSpec) -> BuildingInfo:
         """Get basic building information."""
         total_floors = len(spec.building.floors)
         building_height = sum(floor.height for floor in spec.building.floors)
 
         # Calculate total floor area
-        total_area = 0.0
-        for floor in spec.building.floors:
-            for room in floor.rooms:
-                area = self.geometry_engine.calculate_polygon_area(
-                    room.geometry.coordinates
-                )
-                total_area += area
+        total_area = float(self._floor_areas(spec).sum())
 
-        return {
-            'total_floors': total_floors,
-            'building_height': building_height,
-            'total_floor_area': total_area,
-            'typical_floor_height': spec.building.floors[0].height if spec.building.floors else 0
-        }
+        return BuildingInfo(
+            total_floors=total_floors,
+            building_height=building_height,
+            total_floor_area=total_area,
+            typical_floor_height=spec.building.floors[0].height if spec.building.floors else 0
+        )
+
+    def _floor_areas(self, spec: DesignSpec) -> np.ndarray:
+        """
+        Calculate the total room area of every floor.
+
+        Uses one vectorized shoelace pass over the building's flattened
+        coordinates instead of a geometry call per room.
+
+        Returns:
+            (F,) array of floor areas in m², in spec.building.floors order
+        """
+        coords, room_offsets, floor_of_room = spec.building.coord_blob()
+        room_areas = self.geometry_engine.calculate_polygon_areas(coords, room_offsets)
+        return np.bincount(
+            floor_of_room,
+            weights=room_areas,
+            minlength=len(spec.building.floors)
+        )
 
     def _calculate_loads(
         self,
         spec: DesignSpec,
         building_use: str
-    ) -> Dict[str, Any]:
+    ) -> LoadAnalysis:
         """
         Calculate structural loads.
 
@@ -115,16 +274,7 @@ class StructuralAgent:
         - Occupancy load
         - Movable equipment
         """
-        # Live load per Korean Building Code (kN/m²)
-        live_loads = {
-            'residential': 2.0,  # 주거용
-            'office': 2.5,       # 사무실
-            'retail': 4.0,       # 상업용
-            'storage': 5.0,      # 창고
-            'parking': 2.5       # 주차장
-        }
-
-        live_load = live_loads.get(building_use, 2.0)
+        live_load = _LIVE_LOADS_KN_M2.get(building_use, 2.0)
 
         # Dead load components (kN/m²)
         slab_thickness = 0.15  # 15cm slab
@@ -137,43 +287,50 @@ class StructuralAgent:
         total_dead_load = slab_dead_load + finish_load + partition_load + mep_load
 
         # Calculate total loads per floor
-        loads_by_floor = []
-        for floor in spec.building.floors:
-            floor_area = 0.0
-            for room in floor.rooms:
-                area = self.geometry_engine.calculate_polygon_area(
-                    room.geometry.coordinates
-                )
-                floor_area += area
-
-            dead_load_total = total_dead_load * floor_area  # kN
-            live_load_total = live_load * floor_area  # kN
-
-            # Factored load (for LRFD design)
-            factored_load = (self.dead_load_factor * dead_load_total +
-                           self.live_load_factor * live_load_total)
-
-            loads_by_floor.append({
-                'floor_level': floor.level,
-                'floor_area': floor_area,
-                'dead_load_per_area': total_dead_load,
-                'live_load_per_area': live_load,
-                'total_dead_load': dead_load_total,
-                'total_live_load': live_load_total,
-                'factored_load': factored_load
-            })
+        floor_areas = self._floor_areas(spec)
+
+        # Per-floor totals for all floors at once (kN)
+        dead_load_totals = total_dead_load * floor_areas
+        live_load_totals = live_load * floor_areas
+
+        # Factored load (for LRFD design)
+        factored_loads = (self.dead_load_factor * dead_load_totals +
+                          self.live_load_factor * live_load_totals)
+
+        dead_load_totals = dead_load_totals.tolist()
+        live_load_totals = live_load_totals.tolist()
+        factored_loads = factored_loads.tolist()
+
+        loads_by_floor = tuple(
+            FloorLoad(
+                floor_level=floor.level,
+                floor_area=floor_area,
+                dead_load_per_area=total_dead_load,
+                live_load_per_area=live_load,
+                total_dead_load=dead_load_total,
+                total_live_load=live_load_total,
+                factored_load=factored_load
+            )
+            for floor, floor_area, dead_load_total, live_load_total, factored_load in zip(
+                spec.building.floors,
+                floor_areas.tolist(),
+                dead_load_totals,
+                live_load_totals,
+                factored_loads
+            )
+        )
 
-        return {
-            'building_use': building_use,
-            'live_load_intensity': live_load,
-            'dead_load_intensity': total_dead_load,
-            'loads_by_floor': loads_by_floor,
-            'total_dead_load': sum(f['total_dead_load'] for f in loads_by_floor),
-            'total_live_load': sum(f['total_live_load'] for f in loads_by_floor),
-            'total_factored_load': sum(f['factored_load'] for f in loads_by_floor)
-        }
+        return LoadAnalysis(
+            building_use=building_use,
+            live_load_intensity=live_load,
+            dead_load_intensity=total_dead_load,
+            loads_by_floor=loads_by_floor,
+            total_dead_load=sum(dead_load_totals),
+            total_live_load=sum(live_load_totals),
+            total_factored_load=sum(factored_loads)
+        )
 
-    def _generate_structural_grid(self, spec: DesignSpec) -> Dict[str, Any]:
+    def _generate_structural_grid(self, spec: DesignSpec) -> StructuralGrid:
         """
         Generate structural grid (column layout).
 
@@ -181,7 +338,7 @@ class StructuralAgent:
         """
         # Analyze building footprint
         if not spec.building.floors or not spec.building.floors[0].rooms:
-            return {'grid_lines': [], 'columns': []}
+            return StructuralGrid()
 
         # Get bounding box of first floor
         first_floor = spec.building.floors[0]
@@ -190,7 +347,7 @@ class StructuralAgent:
             all_coords.extend(room.geometry.coordinates[:-1])  # Exclude closing point
 
         if not all_coords:
-            return {'grid_lines': [], 'columns': []}
+            return StructuralGrid()
 
         min_x = min(pt[0] for pt in all_coords)
         max_x = max(pt[0] for pt in all_coords)
@@ -213,28 +370,32 @@ class StructuralAgent:
             y += grid_spacing
 
         # Generate column positions at grid intersections
-        columns = []
-        for i, x in enumerate(x_lines):
-            for j, y in enumerate(y_lines):
-                columns.append({
-                    'id': f"C-{i+1}{chr(65+j)}",  # C-1A, C-1B, etc.
-                    'position': [x, y],
-                    'grid_ref': f"{i+1}{chr(65+j)}"
-                })
+        row_labels = [str(i + 1) for i in range(len(x_lines))]
+        col_labels = [_grid_letter(j) for j in range(len(y_lines))]
+
+        columns = tuple(
+            GridColumn(
+                id='C-' + row_label + col_label,  # C-1A, C-1B, etc.
+                position=(x, y),
+                grid_ref=row_label + col_label
+            )
+            for row_label, x in zip(row_labels, x_lines)
+            for col_label, y in zip(col_labels, y_lines)
+        )
 
-        return {
-            'grid_spacing': grid_spacing,
-            'x_grid_lines': x_lines,
-            'y_grid_lines': y_lines,
-            'column_count': len(columns),
-            'columns': columns
-        }
+        return StructuralGrid(
+            grid_spacing=grid_spacing,
+            x_grid_lines=tuple(x_lines),
+            y_grid_lines=tuple(y_lines),
+            column_count=len(columns),
+            columns=columns
+        )
 
     def _design_columns(
         self,
         spec: DesignSpec,
         building_use: str
-    ) -> Dict[str, Any]:
+    ) -> ColumnDesign:
         """
         Design columns based on loads.
 
@@ -244,11 +405,11 @@ class StructuralAgent:
         load_data = self._calculate_loads(spec, building_use)
         grid_data = self._generate_structural_grid(spec)
 
-        total_factored_load = load_data['total_factored_load']
-        column_count = grid_data['column_count']
+        total_factored_load = load_data.total_factored_load
+        column_count = grid_data.column_count
 
         if column_count == 0:
-            return {'column_size': None, 'columns': []}
+            return ColumnDesign()
 
         # Load per column (simplified - assumes uniform distribution)
         load_per_column = total_factored_load / column_count  # kN
@@ -268,26 +429,53 @@ class StructuralAgent:
         capacity_factor = 0.8 * (0.85 * fck * 0.99 + fy * 0.01 / 1000)  # Convert to MPa
         required_area = load_per_column / capacity_factor  # m²
 
-        # Square column dimension
-        column_size = math.sqrt(required_area) * 1000  # mm
+        # Square column dimension (mm)
+        column_size = int(self._size_columns_batch(required_area))
+
+        return ColumnDesign(
+            design_method='Simplified RC column design',
+            load_per_column=load_per_column,
+            required_area=required_area * 10000,  # cm²
+            column_size=f"{column_size}x{column_size}mm",
+            concrete_strength=fck,
+            steel_grade=f"SD{int(fy)}",
+            columns=grid_data.columns
+        )
 
-        # Round up to nearest 50mm
-        column_size = math.ceil(column_size / 50) * 50
+    @staticmethod
+    def _size_columns_batch(required_areas: Any) -> np.ndarray:
+        """
+        Size square columns from required gross areas.
 
-        # Minimum column size: 300mm
-        column_size = max(column_size, 300)
+        Rounds up to the nearest 50mm with a 300mm minimum. Accepts a scalar
+        or an array of areas and evaluates without per-column branches.
 
-        return {
-            'design_method': 'Simplified RC column design',
-            'load_per_column': load_per_column,
-            'required_area': required_area * 10000,  # cm²
-            'column_size': f"{column_size}x{column_size}mm",
-            'concrete_strength': fck,
-            'steel_grade': f"SD{int(fy)}",
-            'columns': grid_data['columns']
-        }
+        Args:
+            required_areas: Required column area(s) in m²
 
-    def _design_beams(self, spec: DesignSpec) -> Dict[str, Any]:
+        Returns:
+            Column dimension(s) in mm
+        """
+        sizes_mm = np.ceil(np.sqrt(required_areas) * 1000.0 / 50.0) * 50.0
+        return np.maximum(sizes_mm, 300.0)
+
+    @staticmethod
+    def _size_footings_batch(required_areas: Any) -> np.ndarray:
+        """
+        Size square spread footings from required bearing areas.
+
+        Rounds up to the nearest 0.1m with a 1.5m minimum.
+
+        Args:
+            required_areas: Required footing area(s) in m²
+
+        Returns:
+            Footing dimension(s) in meters
+        """
+        sizes_m = np.ceil(np.sqrt(required_areas) * 10.0) / 10.0
+        return np.maximum(sizes_m, 1.5)
+
+    def _design_beams(self, spec: DesignSpec) -> BeamDesign:
         """
         Design beams.
 
@@ -307,19 +495,19 @@ class StructuralAgent:
         # Beam width: typically 300-400mm for residential
         beam_width_mm = 300
 
-        return {
-            'typical_span': span,
-            'beam_size': f"{beam_width_mm}x{beam_depth_mm}mm",
-            'beam_width': beam_width_mm,
-            'beam_depth': beam_depth_mm,
-            'design_note': 'Preliminary sizing - detailed design required'
-        }
+        return BeamDesign(
+            typical_span=span,
+            beam_size=f"{beam_width_mm}x{beam_depth_mm}mm",
+            beam_width=beam_width_mm,
+            beam_depth=beam_depth_mm,
+            design_note='Preliminary sizing - detailed design required'
+        )
 
     def _design_foundation(
         self,
         spec: DesignSpec,
         building_use: str
-    ) -> Dict[str, Any]:
+    ) -> FoundationDesign:
         """
         Preliminary foundation design.
 
@@ -332,85 +520,85 @@ class StructuralAgent:
         load_data = self._calculate_loads(spec, building_use)
         grid_data = self._generate_structural_grid(spec)
 
-        total_load = load_data['total_dead_load'] + load_data['total_live_load']
-        column_count = grid_data['column_count']
+        total_load = load_data.total_dead_load + load_data.total_live_load
+        column_count = grid_data.column_count
 
         if column_count == 0:
-            return {'footing_size': None}
+            return FoundationDesign()
 
         load_per_column = total_load / column_count
 
         # Required footing area
         required_area = load_per_column / soil_bearing_capacity  # m²
 
-        # Square footing dimension
-        footing_size = math.sqrt(required_area)
-
-        # Round up to nearest 0.1m
-        footing_size = math.ceil(footing_size * 10) / 10
-
-        # Minimum footing size: 1.5m
-        footing_size = max(footing_size, 1.5)
-
-        return {
-            'foundation_type': 'Spread Footing',
-            'soil_bearing_capacity': soil_bearing_capacity,
-            'load_per_footing': load_per_column,
-            'required_area': required_area,
-            'footing_size': f"{footing_size}m x {footing_size}m",
-            'footing_thickness': 0.5,  # meters (typical)
-            'design_note': 'Assumes competent soil - geotechnical investigation required'
-        }
+        # Square footing dimension (m)
+        footing_size = float(self._size_footings_batch(required_area))
+
+        return FoundationDesign(
+            foundation_type='Spread Footing',
+            soil_bearing_capacity=soil_bearing_capacity,
+            load_per_footing=load_per_column,
+            required_area=required_area,
+            footing_size=f"{footing_size}m x {footing_size}m",
+            footing_thickness=0.5,  # meters (typical)
+            design_note='Assumes competent soil - geotechnical investigation required'
+        )
 
-    def _check_structural_compliance(self, spec: DesignSpec) -> Dict[str, Any]:
+    def _check_structural_compliance(self, spec: DesignSpec) -> StructuralCompliance:
         """Check compliance with Korean Building Code."""
-        building_height = sum(floor.height for floor in spec.building.floors)
-        floor_count = len(spec.building.floors)
+        min_floor_height = 2.1  # meters (residential minimum)
 
-        # Korean Building Code checks
-        checks = []
+        # Single pass over floors: total height, lowest floor, and pass/fail
+        building_height = 0.0
+        lowest_floor_height = math.inf
+        floor_heights_ok = True
+        for floor in spec.building.floors:
+            height = floor.height
+            building_height += height
+            if height < lowest_floor_height:
+                lowest_floor_height = height
+            if height < min_floor_height:
+                floor_heights_ok = False
 
-        # Height limit check (depends on zone)
-        checks.append({
-            'check': 'Building Height',
-            'value': building_height,
-            'requirement': 'Varies by zoning',
-            'status': 'Review Required'
-        })
+        if not spec.building.floors:
+            lowest_floor_height = 0
 
-        # Floor height check
-        min_floor_height = 2.1  # meters (residential minimum)
-        floor_heights_ok = all(
-            floor.height >= min_floor_height
-            for floor in spec.building.floors
+        # Korean Building Code checks
+        checks = (
+            # Height limit check (depends on zone)
+            ComplianceCheck(
+                check='Building Height',
+                value=building_height,
+                requirement='Varies by zoning',
+                status='Review Required'
+            ),
+            # Floor height check
+            ComplianceCheck(
+                check='Minimum Floor Height',
+                value=lowest_floor_height,
+                requirement=f'>= {min_floor_height}m',
+                status='PASS' if floor_heights_ok else 'FAIL'
+            ),
+            # Seismic design category (depends on location)
+            ComplianceCheck(
+                check='Seismic Design',
+                value='Required for all buildings',
+                requirement='Korean Building Code',
+                status='Design Required'
+            ),
         )
 
-        checks.append({
-            'check': 'Minimum Floor Height',
-            'value': min(floor.height for floor in spec.building.floors) if spec.building.floors else 0,
-            'requirement': f'>= {min_floor_height}m',
-            'status': 'PASS' if floor_heights_ok else 'FAIL'
-        })
-
-        # Seismic design category (depends on location)
-        checks.append({
-            'check': 'Seismic Design',
-            'value': 'Required for all buildings',
-            'requirement': 'Korean Building Code',
-            'status': 'Design Required'
-        })
-
-        all_pass = all(c['status'] == 'PASS' for c in checks if c['status'] in ['PASS', 'FAIL'])
+        all_pass = all(c.status == 'PASS' for c in checks if c.status in ('PASS', 'FAIL'))
 
-        return {
-            'checks': checks,
-            'overall_status': 'PASS' if all_pass else 'REVIEW REQUIRED',
-            'note': 'Detailed structural analysis required for construction'
-        }
+        return StructuralCompliance(
+            checks=checks,
+            overall_status='PASS' if all_pass else 'REVIEW REQUIRED',
+            note='Detailed structural analysis required for construction'
+        )
 
     def generate_report(
         self,
-        analysis_results: Dict[str, Any],
+        analysis_results: StructuralAnalysis,
         output_path: Path
     ):
         """
@@ -420,11 +608,12 @@ class StructuralAgent:
             analysis_results: Results from analyze_structure()
             output_path: Path for output JSON file
         """
+        from ..utils.json_io import write_json
+
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(analysis_results, f, indent=2, ensure_ascii=False)
+        write_json(output_path, analysis_results)
 
     def get_capabilities(self) -> Dict[str, Any]:
         """
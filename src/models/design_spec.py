@@ -4,8 +4,10 @@ These models correspond to the JSON schema defined in config/schemas/design_spec
 """
 
 from enum import Enum
-from typing import List, Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
 
 
 class ZoningType(str, Enum):
@@ -116,24 +118,19 @@ class Materials(BaseModel):
     roofing: Optional[str] = None
 
 
+# [x, y] pair; length is checked by pydantic-core, mirroring the schema's minItems/maxItems
+Coordinate = Annotated[List[float], Field(min_length=2, max_length=2)]
+
+
 class Polygon(BaseModel):
     """Polygon geometry (GeoJSON-like format)."""
     type: str = Field("Polygon", description="Geometry type")
-    coordinates: List[List[float]] = Field(
+    coordinates: List[Coordinate] = Field(
         ...,
         min_length=3,
         description="Array of [x, y] coordinate pairs forming a closed polygon"
     )
 
-    @field_validator('coordinates')
-    @classmethod
-    def validate_coordinates(cls, v):
-        """Validate that each coordinate is a [x, y] pair."""
-        for coord in v:
-            if len(coord) != 2:
-                raise ValueError("Each coordinate must be [x, y] pair")
-        return v
-
 
 class Door(BaseModel):
     """Door specification."""
@@ -210,6 +207,35 @@ class Building(BaseModel):
     structure: Optional[Structure] = None
     materials: Optional[Materials] = None
 
+    def coord_blob(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Flattened room coordinates for vectorized geometry.
+
+        Rooms are ordered floor by floor; room r spans
+        coords[room_offsets[r]:room_offsets[r + 1]]. Built on every call
+        (not cached), since the model and its coordinate lists are mutable.
+
+        Returns:
+            Tuple of (coords[N, 2], room_offsets[R + 1], floor_of_room[R])
+        """
+        room_coords = []
+        floor_of_room = []
+        for floor_index, floor in enumerate(self.floors):
+            for room in floor.rooms:
+                room_coords.append(room.geometry.coordinates)
+                floor_of_room.append(floor_index)
+
+        counts = np.fromiter((len(c) for c in room_coords), dtype=np.intp, count=len(room_coords))
+        room_offsets = np.zeros(len(room_coords) + 1, dtype=np.intp)
+        np.cumsum(counts, out=room_offsets[1:])
+
+        if room_coords:
+            coords = np.array([pt for c in room_coords for pt in c], dtype=np.float64)
+        else:
+            coords = np.empty((0, 2), dtype=np.float64)
+
+        return coords, room_offsets, np.array(floor_of_room, dtype=np.intp)
+
 
 class DesignSpec(BaseModel):
     """
@@ -5,13 +5,14 @@ This module contains the orchestrator agent that coordinates between
 user input (natural language), JSON spec generation, and implementation agents.
 """
 
-from .orchestrator_agent import OrchestratorAgent
+from .orchestrator_agent import OrchestratorAgent, OrchestratorResponse
 from .conversation_manager import ConversationManager
 from .spec_generator import SpecGenerator
 from .task_distributor import TaskDistributor
 
 __all__ = [
     'OrchestratorAgent',
+    'OrchestratorResponse',
     'ConversationManager',
     'SpecGenerator',
     'TaskDistributor',
@@ -4,25 +4,51 @@ Conversation Manager for Orchestrator Agent.
 Manages conversation state, history, and context for multi-turn interactions.
 """
 
-from typing import List, Dict, Any, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Deque, List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
-import json
 from pathlib import Path
+import os
+import sys
+import time
+
+from ..utils.json_io import ZSTD_AVAILABLE, dumps_bytes, loads, read_json, write_bytes
+
+
+# Canonical role strings; roles read from session files are mapped onto these
+_ROLE_USER = sys.intern('user')
+_ROLE_ASSISTANT = sys.intern('assistant')
+_ROLE_SYSTEM = sys.intern('system')
+_ROLE_MAP = {role: role for role in (_ROLE_USER, _ROLE_ASSISTANT, _ROLE_SYSTEM)}
+
+
+def _as_timestamp(value: Union[float, str, datetime]) -> float:
+    """Coerce a POSIX timestamp, ISO-8601 string or datetime to POSIX seconds."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):  # Sessions saved before timestamps were numeric
+        value = datetime.fromisoformat(value)
+    return value.timestamp()
 
 
 class Message:
     """Represents a single message in the conversation."""
 
+    __slots__ = ('role', 'content', 'timestamp', 'metadata')
+
     def __init__(
         self,
         role: str,
         content: str,
-        timestamp: Optional[datetime] = None,
+        timestamp: Optional[Union[float, datetime]] = None,
         metadata: Optional[Dict[str, Any]] = None
     ):
-        self.role = role  # 'user', 'assistant', 'system'
+        self.role = _ROLE_MAP.get(role) or sys.intern(role)  # 'user', 'assistant', 'system'
         self.content = content
-        self.timestamp = timestamp or datetime.now()
+        # POSIX seconds; cheaper to create and serialize than datetime objects
+        self.timestamp = time.time() if timestamp is None else _as_timestamp(timestamp)
         self.metadata = metadata or {}
 
     def to_dict(self) -> Dict[str, Any]:
@@ -30,7 +56,7 @@ class Message:
         return {
             'role': self.role,
             'content': self.content,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self.timestamp,
             'metadata': self.metadata
         }
 
@@ -40,7 +66,7 @@ class Message:
         return cls(
             role=data['role'],
             content=data['content'],
-            timestamp=datetime.fromisoformat(data['timestamp']),
+            timestamp=_as_timestamp(data['timestamp']),
             metadata=data.get('metadata', {})
         )
 
@@ -48,10 +74,13 @@ class Message:
 class ConversationState:
     """Represents the current state of the conversation."""
 
+    __slots__ = ('design_spec', 'active_tasks', 'completed_tasks', 'context', 'phase')
+
     def __init__(self):
         self.design_spec: Optional[Dict[str, Any]] = None
-        self.active_tasks: List[str] = []
-        self.completed_tasks: List[str] = []
+        # Insertion-ordered task id sets (dict keys; values unused)
+        self.active_tasks: Dict[str, None] = {}
+        self.completed_tasks: Dict[str, None] = {}
         self.context: Dict[str, Any] = {}
         self.phase: str = "initial"  # initial, spec_creation, refinement, execution, complete
 
@@ -59,8 +88,8 @@ class ConversationState:
         """Convert state to dictionary."""
         return {
             'design_spec': self.design_spec,
-            'active_tasks': self.active_tasks,
-            'completed_tasks': self.completed_tasks,
+            'active_tasks': list(self.active_tasks),
+            'completed_tasks': list(self.completed_tasks),
             'context': self.context,
             'phase': self.phase
         }
@@ -70,8 +99,8 @@ class ConversationState:
         """Create state from dictionary."""
         state = cls()
         state.design_spec = data.get('design_spec')
-        state.active_tasks = data.get('active_tasks', [])
-        state.completed_tasks = data.get('completed_tasks', [])
+        state.active_tasks = dict.fromkeys(data.get('active_tasks', []))
+        state.completed_tasks = dict.fromkeys(data.get('completed_tasks', []))
         state.context = data.get('context', {})
         state.phase = data.get('phase', 'initial')
         return state
@@ -88,21 +117,89 @@ class ConversationManager:
     - Save/load conversation sessions
     """
 
-    def __init__(self, session_id: Optional[str] = None):
+    def __init__(
+        self,
+        session_id: Optional[str] = None,
+        max_history: Optional[int] = None,
+        log_dir: Optional[Path] = None
+    ):
         """
         Initialize conversation manager.
 
         Args:
             session_id: Optional session identifier for persistence
+            max_history: Number of recent messages kept in memory (unbounded if None)
+            log_dir: Directory for the append-only message log; every message
+                is written there as one JSON line (no log if None)
         """
         self.session_id = session_id or self._generate_session_id()
-        self.messages: List[Message] = []
+        self.max_history = max_history
+        self.log_dir = Path(log_dir) if log_dir else None
+        self._log_fp = None  # Opened on first write
+        # Messages are stored column-wise; Message objects are built on demand
+        self._roles: Deque[str] = deque(maxlen=max_history)
+        self._contents: Deque[str] = deque(maxlen=max_history)
+        self._timestamps: Deque[float] = deque(maxlen=max_history)
+        self._metadata: Deque[Dict[str, Any]] = deque(maxlen=max_history)
+        # User/assistant messages pre-formatted for the Claude API
+        self._llm_messages: Deque[Dict[str, str]] = deque(maxlen=max_history)
         self.state = ConversationState()
-        self.created_at = datetime.now()
+        self.created_at = time.time()
+        # Bumped by every mutator so the summary is only rebuilt after a change
+        self._version = 0
+        self._summary_cache: Optional[Tuple[int, str]] = None
+        # Session snapshots are written off the request path, in submission order
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='session-io')
+        self._closed = False
+
+    @property
+    def messages(self) -> List[Message]:
+        """Conversation history as Message objects (built on each access)."""
+        return self._build_messages(0)
+
+    @property
+    def log_file(self) -> Optional[Path]:
+        """JSON lines file holding the full message history."""
+        if self.log_dir is None:
+            return None
+        return self.log_dir / f"{self.session_id}.jsonl"
+
+    def _build_messages(self, start: int) -> List[Message]:
+        """Build Message views for the columns from ``start`` onwards."""
+        columns = (self._roles, self._contents, self._timestamps, self._metadata)
+        return [
+            Message(role, content, timestamp, metadata)
+            for role, content, timestamp, metadata in zip(
+                *(islice(column, start, None) for column in columns)
+            )
+        ]
+
+    def _log_message(self, message: Message):
+        """Append a message to the on-disk message log."""
+        if self._log_fp is None:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            self._log_fp = open(self.log_file, 'ab', buffering=1024 * 1024)
+        self._log_fp.write(dumps_bytes(message.to_dict(), indent=False) + b'\n')
+
+    def _append_message(self, message: Message):
+        """Append a message to the column store (the oldest drops out when full)."""
+        role = message.role
+        self._roles.append(role)
+        self._contents.append(message.content)
+        self._timestamps.append(message.timestamp)
+        self._metadata.append(message.metadata)
+        # Roles are interned in Message, so identity checks suffice
+        if role is _ROLE_USER or role is _ROLE_ASSISTANT:  # System messages are never sent
+            self._llm_messages.append({'role': role, 'content': message.content})
+        self._version += 1
 
     def _generate_session_id(self) -> str:
         """Generate a unique session ID."""
-        return f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        t = time.localtime()  # Formatted by hand; strftime is comparatively slow
+        return (
+            f"session_{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}"
+            f"_{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}"
+        )
 
     def add_message(
         self,
@@ -122,20 +219,22 @@ class ConversationManager:
             The created message
         """
         message = Message(role=role, content=content, metadata=metadata)
-        self.messages.append(message)
+        if self.log_dir is not None:
+            self._log_message(message)
+        self._append_message(message)
         return message
 
     def add_user_message(self, content: str) -> Message:
         """Add a user message."""
-        return self.add_message('user', content)
+        return self.add_message(_ROLE_USER, content)
 
     def add_assistant_message(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> Message:
         """Add an assistant message."""
-        return self.add_message('assistant', content, metadata)
+        return self.add_message(_ROLE_ASSISTANT, content, metadata)
 
     def add_system_message(self, content: str) -> Message:
         """Add a system message."""
-        return self.add_message('system', content)
+        return self.add_message(_ROLE_SYSTEM, content)
 
     def get_recent_messages(self, count: int = 10) -> List[Message]:
         """
@@ -147,7 +246,23 @@ class ConversationManager:
         Returns:
             List of recent messages
         """
-        return self.messages[-count:] if count < len(self.messages) else self.messages
+        return self._build_messages(max(len(self._roles) - count, 0))
+
+    def get_message_dicts(self) -> List[Dict[str, Any]]:
+        """
+        Get the in-memory history serialized like Message.to_dict().
+
+        Built straight from the columns, without creating Message objects.
+
+        Returns:
+            List of message dictionaries
+        """
+        return [
+            {'role': role, 'content': content, 'timestamp': timestamp, 'metadata': metadata}
+            for role, content, timestamp, metadata in zip(
+                self._roles, self._contents, self._timestamps, self._metadata
+            )
+        ]
 
     def get_messages_for_llm(self, max_messages: int = 20) -> List[Dict[str, str]]:
         """
@@ -159,12 +274,8 @@ class ConversationManager:
         Returns:
             List of message dictionaries with 'role' and 'content'
         """
-        recent_messages = self.get_recent_messages(max_messages)
-        return [
-            {'role': msg.role, 'content': msg.content}
-            for msg in recent_messages
-            if msg.role in ['user', 'assistant']  # Exclude system messages
-        ]
+        start = max(len(self._llm_messages) - max_messages, 0)
+        return list(islice(self._llm_messages, start, None))
 
     def update_state(
         self,
@@ -189,17 +300,18 @@ class ConversationManager:
         if context_updates:
             self.state.context.update(context_updates)
 
+        self._version += 1
+
     def add_task(self, task_id: str):
         """Add a task to active tasks."""
-        if task_id not in self.state.active_tasks:
-            self.state.active_tasks.append(task_id)
+        self.state.active_tasks[task_id] = None
+        self._version += 1
 
     def complete_task(self, task_id: str):
         """Mark a task as completed."""
-        if task_id in self.state.active_tasks:
-            self.state.active_tasks.remove(task_id)
-        if task_id not in self.state.completed_tasks:
-            self.state.completed_tasks.append(task_id)
+        self.state.active_tasks.pop(task_id, None)
+        self.state.completed_tasks[task_id] = None
+        self._version += 1
 
     def get_conversation_summary(self) -> str:
         """
@@ -208,10 +320,13 @@ class ConversationManager:
         Returns:
             Summary string
         """
+        if self._summary_cache is not None and self._summary_cache[0] == self._version:
+            return self._summary_cache[1]
+
         summary_parts = [
             f"Session ID: {self.session_id}",
             f"Phase: {self.state.phase}",
-            f"Messages: {len(self.messages)}",
+            f"Messages: {len(self._roles)}",
             f"Active Tasks: {len(self.state.active_tasks)}",
             f"Completed Tasks: {len(self.state.completed_tasks)}",
         ]
@@ -219,52 +334,144 @@ class ConversationManager:
         if self.state.design_spec:
             summary_parts.append("Design Spec: Created")
 
-        return "\n".join(summary_parts)
+        summary = "\n".join(summary_parts)
+        self._summary_cache = (self._version, summary)
+        return summary
 
-    def save_session(self, output_dir: Path):
+    def save_session(self, output_dir: Path, compress: Optional[bool] = None) -> Future:
         """
         Save conversation session to disk.
 
+        The snapshot is serialized immediately; compression and the file write
+        run on a background thread. Call close() (or wait on the returned
+        future) to make sure it has been flushed. After close() the file is
+        written synchronously and an already-completed future is returned.
+
         Args:
             output_dir: Directory to save session data
+            compress: Write zstd-compressed ``.json.zst`` instead of ``.json``
+                (defaults to True when zstandard is installed)
+
+        Returns:
+            Future that completes once the session file is written
         """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        session_file = output_dir / f"{self.session_id}.json"
+        if compress is None:
+            compress = ZSTD_AVAILABLE
+        suffix = ".json.zst" if compress else ".json"
+        session_file = output_dir / f"{self.session_id}{suffix}"
 
         session_data = {
             'session_id': self.session_id,
-            'created_at': self.created_at.isoformat(),
-            'messages': [msg.to_dict() for msg in self.messages],
+            'created_at': self.created_at,
             'state': self.state.to_dict()
         }
-
-        with open(session_file, 'w', encoding='utf-8') as f:
-            json.dump(session_data, f, indent=2, ensure_ascii=False)
+        if self.log_dir is not None:
+            # Messages are already in the append-only log; only the header is rewritten
+            if self._log_fp is not None:
+                self._log_fp.flush()
+            else:
+                # Saved before the first message: an empty log marks "no messages
+                # yet", so load_session can treat a missing log as an error
+                self.log_dir.mkdir(parents=True, exist_ok=True)
+                self.log_file.touch()
+            session_data['message_log'] = self._log_path_for(output_dir)
+        else:
+            session_data['messages'] = self.get_message_dicts()
+
+        # Session files are machine-read; compact output is smaller and parses faster
+        payload = dumps_bytes(session_data, indent=False)
+        if self._closed:
+            write_bytes(session_file, payload)
+            future: Future = Future()
+            future.set_result(None)
+            return future
+        return self._io_pool.submit(write_bytes, session_file, payload)
+
+    def _log_path_for(self, output_dir: Path) -> str:
+        """Path of the message log as stored in a session file in output_dir."""
+        log_file = self.log_file.resolve()
+        try:
+            # Relative to the session file, so the pair can be moved together
+            # and loaded from any working directory
+            return Path(os.path.relpath(log_file, output_dir.resolve())).as_posix()
+        except ValueError:  # Different drive on Windows
+            return str(log_file)
 
     @classmethod
-    def load_session(cls, session_file: Path) -> 'ConversationManager':
+    def load_session(
+        cls,
+        session_file: Path,
+        max_history: Optional[int] = None
+    ) -> 'ConversationManager':
         """
         Load conversation session from disk.
 
         Args:
-            session_file: Path to session file
+            session_file: Path to session file (``.json`` or ``.json.zst``)
+            max_history: Number of recent messages kept in memory (unbounded if None)
 
         Returns:
             Loaded conversation manager
         """
-        with open(session_file, 'r', encoding='utf-8') as f:
-            session_data = json.load(f)
-
-        manager = cls(session_id=session_data['session_id'])
-        manager.created_at = datetime.fromisoformat(session_data['created_at'])
-        manager.messages = [Message.from_dict(msg) for msg in session_data['messages']]
+        session_file = Path(session_file)
+        session_data = read_json(session_file)
+
+        message_log = session_data.get('message_log')
+        log_path = None
+        if message_log:
+            log_path = Path(message_log)
+            if not log_path.is_absolute():
+                log_path = session_file.parent / log_path
+            if not log_path.exists():
+                raise FileNotFoundError(
+                    f"Message log {message_log!r} of session {session_data['session_id']} "
+                    f"not found (looked for {log_path})"
+                )
+            log_path = log_path.resolve()
+
+        manager = cls(
+            session_id=session_data['session_id'],
+            max_history=max_history,
+            # Keep appending to the same log so later saves stay complete
+            log_dir=log_path.parent if log_path else None
+        )
+        manager.created_at = _as_timestamp(session_data['created_at'])
+        if log_path:
+            with open(log_path, 'rb') as f:
+                for line in f:
+                    manager._append_message(Message.from_dict(loads(line)))
+        else:
+            for msg in session_data['messages']:
+                manager._append_message(Message.from_dict(msg))
         manager.state = ConversationState.from_dict(session_data['state'])
+        manager._version += 1
 
         return manager
 
+    def close(self):
+        """Flush the message log and wait for pending session writes."""
+        if self._log_fp is not None:
+            self._log_fp.close()
+            self._log_fp = None
+        self._closed = True
+        self._io_pool.shutdown(wait=True)
+
     def clear(self):
         """Clear conversation history and state."""
-        self.messages.clear()
+        self._roles.clear()
+        self._contents.clear()
+        self._timestamps.clear()
+        self._metadata.clear()
+        self._llm_messages.clear()
+        if self.log_dir is not None:
+            # Start the log over so a reloaded session does not resurrect old
+            # messages (also when nothing has been logged since loading)
+            if self._log_fp is not None:
+                self._log_fp.close()
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            self._log_fp = open(self.log_file, 'wb', buffering=1024 * 1024)
         self.state = ConversationState()
+        self._version += 1
@@ -5,15 +5,80 @@ This is the central agent that manages the entire workflow from natural language
 input to CAD file generation.
 """
 
-from typing import Dict, Any, Optional, List
+from concurrent.futures import Future, ThreadPoolExecutor
+import copy
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
-import json
+import logging
 import os
+import re
+import threading
 
 from .conversation_manager import ConversationManager
 from .spec_generator import SpecGenerator
 from .task_distributor import TaskDistributor, AgentType
 from ..models.design_spec import DesignSpec
+from ..utils.json_io import dumps_bytes, read_json, write_json
+
+
+# Canned response text (shared by reference)
+_SPEC_GENERATED_MESSAGE = '설계 사양이 생성되었습니다. 검토 후 수정이 필요하면 말씀해주세요.'
+_SPEC_REFINED_MESSAGE = '설계 사양이 수정되었습니다. 추가 수정이 필요하거나 실행하려면 말씀해주세요.'
+_NO_SPEC_MESSAGE = '실행할 설계 사양이 없습니다. 먼저 설계를 생성해주세요.'
+
+_INITIAL_NEXT_STEPS = (
+    '설계 내용을 검토해주세요',
+    '수정이 필요하면 구체적으로 말씀해주세요',
+    '문제가 없다면 "실행" 또는 "생성"이라고 말씀해주세요'
+)
+
+_GENERAL_QUERY_MESSAGE = '새로운 설계를 시작하려면 건물이나 공간에 대해 설명해주세요.'
+_GENERAL_QUERY_COMMANDS = (
+    '새 설계 시작',
+    '이전 설계 불러오기',
+    '도움말'
+)
+
+
+@dataclass(slots=True)
+class OrchestratorResponse:
+    """Result of one orchestrator turn; unset optional fields are omitted from to_dict()."""
+    status: str
+    message: str
+    action: Optional[str] = None
+    design_spec: Optional[Dict[str, Any]] = None
+    next_steps: Optional[Tuple[str, ...]] = None
+    changes: Optional[str] = None
+    spec_file: Optional[str] = None
+    execution: Optional['OrchestratorResponse'] = None
+    task_status: Optional[Dict[str, Any]] = None
+    results: Optional[Dict[str, Any]] = None
+    output_files: Optional[List[Optional[str]]] = None
+    available_commands: Optional[Tuple[str, ...]] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the response dictionary layout (only fields that are set)."""
+        response = {'status': self.status}
+        if self.action is not None:
+            response['action'] = self.action
+        response['message'] = self.message
+        for name in _OPTIONAL_RESPONSE_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                response[name] = value.to_dict() if name == 'execution' else value
+        return response
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize the response to compact JSON in one pass."""
+        return dumps_bytes(self.to_dict(), indent=False)
+
+
+_OPTIONAL_RESPONSE_FIELDS = (
+    'design_spec', 'next_steps', 'changes', 'spec_file', 'execution',
+    'task_status', 'results', 'output_files', 'available_commands', 'error'
+)
 
 
 class OrchestratorAgent:
@@ -28,6 +93,12 @@ class OrchestratorAgent:
     5. Collect and present results
     """
 
+    # Messages kept in memory; the full history is logged to the session directory
+    MAX_HISTORY = 64
+
+    # Trigger words that switch refinement into execution (single regex scan)
+    _EXEC_TRIGGER = re.compile(r'실행|생성|execute|generate|create|만들어', re.IGNORECASE)
+
     def __init__(
         self,
         schema_path: Path,
@@ -45,28 +116,60 @@ class OrchestratorAgent:
             session_id: Optional session ID for conversation
         """
         self.schema_path = Path(schema_path)
+        # Parsed once and shared by the spec generator, task distributor and agents
+        self.schema = read_json(self.schema_path)
         self.output_dir = Path(output_dir) if output_dir else Path("./output")
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         # Initialize components
-        self.conversation = ConversationManager(session_id=session_id)
+        self.conversation = ConversationManager(
+            session_id=session_id,
+            max_history=self.MAX_HISTORY,
+            log_dir=self.output_dir / "sessions"
+        )
         self.spec_generator = SpecGenerator(
             schema_path=schema_path,
-            api_key=api_key
+            api_key=api_key,
+            schema=self.schema
         )
         self.task_distributor = TaskDistributor(
             schema_path=schema_path,
-            output_dir=self.output_dir
+            output_dir=self.output_dir,
+            schema=self.schema
         )
 
         # Current design spec
-        self.current_spec: Optional[DesignSpec] = None
+        self.current_spec = None
+
+        # Spec files are written off the request path, in submission order
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='spec-io')
+        # Writes not yet known to have succeeded; failed ones stay here until
+        # flush_spec_writes() re-raises them
+        self._pending_spec_writes: List[Future] = []
+        self._pending_lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def current_spec(self) -> Optional[DesignSpec]:
+        """Current design specification model."""
+        return self._current_spec
+
+    @current_spec.setter
+    def current_spec(self, spec: Optional[DesignSpec]):
+        self._current_spec = spec
+        self._current_spec_dict: Optional[Dict[str, Any]] = None  # Dumped lazily
+
+    def _get_spec_dict(self) -> Dict[str, Any]:
+        """Return model_dump() of the current spec, cached until it is replaced."""
+        if self._current_spec_dict is None:
+            self._current_spec_dict = self._current_spec.model_dump()
+        return self._current_spec_dict
 
     def process_message(
         self,
         user_message: str,
         auto_execute: bool = False
-    ) -> Dict[str, Any]:
+    ) -> OrchestratorResponse:
         """
         Process a message from the user.
 
@@ -75,7 +178,7 @@ class OrchestratorAgent:
             auto_execute: If True, automatically execute tasks after spec generation
 
         Returns:
-            Response dictionary with status and content
+            Response with status and content
         """
         # Add user message to conversation
         self.conversation.add_user_message(user_message)
@@ -100,7 +203,7 @@ class OrchestratorAgent:
         self,
         user_message: str,
         auto_execute: bool
-    ) -> Dict[str, Any]:
+    ) -> OrchestratorResponse:
         """
         Handle initial design request.
 
@@ -109,7 +212,7 @@ class OrchestratorAgent:
             auto_execute: Whether to auto-execute tasks
 
         Returns:
-            Response dictionary
+            Orchestrator response
         """
         try:
             # Generate spec from natural language
@@ -124,51 +227,45 @@ class OrchestratorAgent:
                 phase="refinement"
             )
 
-            response = {
-                'status': 'success',
-                'action': 'spec_generated',
-                'message': '설계 사양이 생성되었습니다. 검토 후 수정이 필요하면 말씀해주세요.',
-                'design_spec': spec_dict,
-                'next_steps': [
-                    '설계 내용을 검토해주세요',
-                    '수정이 필요하면 구체적으로 말씀해주세요',
-                    '문제가 없다면 "실행" 또는 "생성"이라고 말씀해주세요'
-                ]
-            }
-
-            # Save spec to file
             spec_file = self.output_dir / "design_spec.json"
-            with open(spec_file, 'w', encoding='utf-8') as f:
-                json.dump(spec_dict, f, indent=2, ensure_ascii=False)
-            response['spec_file'] = str(spec_file)
+            response = OrchestratorResponse(
+                status='success',
+                action='spec_generated',
+                message=_SPEC_GENERATED_MESSAGE,
+                design_spec=spec_dict,
+                next_steps=_INITIAL_NEXT_STEPS,
+                spec_file=str(spec_file)
+            )
 
             self.conversation.add_assistant_message(
-                response['message'],
+                response.message,
                 metadata={'design_spec': spec_dict}
             )
 
+            # Save spec to file off the response path
+            self._write_spec_async(spec_file, spec_dict)
+
             # Auto-execute if requested
             if auto_execute:
-                exec_result = self.execute_design()
-                response['execution'] = exec_result
+                response.execution = self.execute_design()
 
             return response
 
         except Exception as e:
             error_msg = f"설계 사양 생성 중 오류 발생: {str(e)}"
             self.conversation.add_assistant_message(error_msg)
-            return {
-                'status': 'error',
-                'action': 'spec_generation_failed',
-                'message': error_msg,
-                'error': str(e)
-            }
+            return OrchestratorResponse(
+                status='error',
+                action='spec_generation_failed',
+                message=error_msg,
+                error=str(e)
+            )
 
     def _handle_refinement(
         self,
         user_message: str,
         auto_execute: bool
-    ) -> Dict[str, Any]:
+    ) -> OrchestratorResponse:
         """
         Handle refinement of existing spec.
 
@@ -177,18 +274,16 @@ class OrchestratorAgent:
             auto_execute: Whether to auto-execute tasks
 
         Returns:
-            Response dictionary
+            Orchestrator response
         """
         # Check for execution trigger words
-        execution_keywords = ['실행', '생성', 'execute', 'generate', 'create', '만들어']
-        if any(keyword in user_message.lower() for keyword in execution_keywords):
+        if self._EXEC_TRIGGER.search(user_message):
             return self.execute_design()
 
         # Otherwise, refine the spec
         try:
-            current_spec_dict = self.current_spec.model_dump()
             refined_spec_dict = self.spec_generator.refine_spec(
-                current_spec=current_spec_dict,
+                current_spec=self._get_spec_dict(),
                 feedback=user_message
             )
 
@@ -196,80 +291,68 @@ class OrchestratorAgent:
             self.current_spec = DesignSpec(**refined_spec_dict)
             self.conversation.update_state(design_spec=refined_spec_dict)
 
-            response = {
-                'status': 'success',
-                'action': 'spec_refined',
-                'message': '설계 사양이 수정되었습니다. 추가 수정이 필요하거나 실행하려면 말씀해주세요.',
-                'design_spec': refined_spec_dict,
-                'changes': '사용자 요청에 따라 수정됨'
-            }
+            response = OrchestratorResponse(
+                status='success',
+                action='spec_refined',
+                message=_SPEC_REFINED_MESSAGE,
+                design_spec=refined_spec_dict,
+                changes='사용자 요청에 따라 수정됨'
+            )
 
-            # Save updated spec
-            spec_file = self.output_dir / "design_spec.json"
-            with open(spec_file, 'w', encoding='utf-8') as f:
-                json.dump(refined_spec_dict, f, indent=2, ensure_ascii=False)
+            self.conversation.add_assistant_message(response.message)
 
-            self.conversation.add_assistant_message(response['message'])
+            # Save updated spec off the response path
+            self._write_spec_async(self.output_dir / "design_spec.json", refined_spec_dict)
 
             # Auto-execute if requested
             if auto_execute:
-                exec_result = self.execute_design()
-                response['execution'] = exec_result
+                response.execution = self.execute_design()
 
             return response
 
         except Exception as e:
             error_msg = f"설계 수정 중 오류 발생: {str(e)}"
             self.conversation.add_assistant_message(error_msg)
-            return {
-                'status': 'error',
-                'action': 'refinement_failed',
-                'message': error_msg,
-                'error': str(e)
-            }
-
-    def _handle_execution_query(self, user_message: str) -> Dict[str, Any]:
+            return OrchestratorResponse(
+                status='error',
+                action='refinement_failed',
+                message=error_msg,
+                error=str(e)
+            )
+
+    def _handle_execution_query(self, user_message: str) -> OrchestratorResponse:
         """Handle queries during/after execution."""
         task_status = self.task_distributor.get_task_status()
 
-        response = {
-            'status': 'success',
-            'action': 'execution_status',
-            'message': f"작업 진행 상황: {task_status['by_status']}",
-            'task_status': task_status
-        }
+        response = OrchestratorResponse(
+            status='success',
+            action='execution_status',
+            message=f"작업 진행 상황: {task_status['by_status']}",
+            task_status=task_status
+        )
 
-        self.conversation.add_assistant_message(response['message'])
+        self.conversation.add_assistant_message(response.message)
         return response
 
-    def _handle_general_query(self, user_message: str) -> Dict[str, Any]:
+    def _handle_general_query(self, user_message: str) -> OrchestratorResponse:
         """Handle general queries."""
-        response = {
-            'status': 'success',
-            'action': 'info',
-            'message': '새로운 설계를 시작하려면 건물이나 공간에 대해 설명해주세요.',
-            'available_commands': [
-                '새 설계 시작',
-                '이전 설계 불러오기',
-                '도움말'
-            ]
-        }
-
-        self.conversation.add_assistant_message(response['message'])
-        return response
+        self.conversation.add_assistant_message(_GENERAL_QUERY_MESSAGE)
+        return OrchestratorResponse(
+            status='success',
+            action='info',
+            message=_GENERAL_QUERY_MESSAGE,
+            available_commands=_GENERAL_QUERY_COMMANDS
+        )
 
-    def execute_design(self) -> Dict[str, Any]:
+    def execute_design(self) -> OrchestratorResponse:
         """
         Execute the current design specification.
 
         Returns:
-            Execution results
+            Orchestrator response with execution results
         """
         if not self.current_spec:
-            return {
-                'status': 'error',
-                'message': '실행할 설계 사양이 없습니다. 먼저 설계를 생성해주세요.'
-            }
+            return OrchestratorResponse(status='error', message=_NO_SPEC_MESSAGE)
 
         try:
             # Update phase
@@ -284,16 +367,22 @@ class OrchestratorAgent:
             # Update phase
             self.conversation.update_state(phase="complete")
 
-            response = {
-                'status': 'success',
-                'action': 'execution_complete',
-                'message': f"설계 실행 완료! {results['completed']}개 작업 성공, {results['failed']}개 실패",
-                'results': results,
-                'output_files': [output['result'].get('output_file') for output in results['outputs']]
-            }
+            response = OrchestratorResponse(
+                status='success',
+                action='execution_complete',
+                message=f"설계 실행 완료! {results['completed']}개 작업 성공, {results['failed']}개 실패",
+                results=results,
+                output_files=[
+                    output_file
+                    for output in results['outputs']
+                    for output_file in output['result'].get(
+                        'output_files', [output['result'].get('output_file')]
+                    )
+                ]
+            )
 
             self.conversation.add_assistant_message(
-                response['message'],
+                response.message,
                 metadata={'results': results}
             )
 
@@ -302,22 +391,23 @@ class OrchestratorAgent:
         except Exception as e:
             error_msg = f"실행 중 오류 발생: {str(e)}"
             self.conversation.add_assistant_message(error_msg)
-            return {
-                'status': 'error',
-                'action': 'execution_failed',
-                'message': error_msg,
-                'error': str(e)
-            }
+            return OrchestratorResponse(
+                status='error',
+                action='execution_failed',
+                message=error_msg,
+                error=str(e)
+            )
 
     def get_current_spec(self) -> Optional[Dict[str, Any]]:
         """
         Get current design specification.
 
         Returns:
-            Current design spec as dictionary, or None
+            Copy of the current design spec as dictionary (safe to modify), or None
         """
         if self.current_spec:
-            return self.current_spec.model_dump()
+            # Deep copy: the cached dict is shared with refinement and file writes
+            return copy.deepcopy(self._get_spec_dict())
         return None
 
     def save_spec_to_file(self, output_path: Path):
@@ -330,9 +420,7 @@ class OrchestratorAgent:
         if not self.current_spec:
             raise ValueError("No design spec to save")
 
-        output_path = Path(output_path)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.current_spec.model_dump(), f, indent=2, ensure_ascii=False)
+        write_json(Path(output_path), self._get_spec_dict())
 
     def load_spec_from_file(self, input_path: Path):
         """
@@ -341,9 +429,7 @@ class OrchestratorAgent:
         Args:
             input_path: Path to input file
         """
-        input_path = Path(input_path)
-        with open(input_path, 'r', encoding='utf-8') as f:
-            spec_dict = json.load(f)
+        spec_dict = read_json(Path(input_path))
 
         self.current_spec = DesignSpec(**spec_dict)
         self.conversation.update_state(
@@ -358,12 +444,87 @@ class OrchestratorAgent:
         Returns:
             List of message dictionaries
         """
-        return [msg.to_dict() for msg in self.conversation.messages]
+        return self.conversation.get_message_dicts()
+
+    def save_session(self) -> Future:
+        """
+        Save current session to disk.
 
-    def save_session(self):
-        """Save current session to disk."""
+        The file is written in the background; a failed write is logged. After
+        close() the session is written synchronously instead.
+
+        Returns:
+            Future that completes once the session file is written
+        """
         session_dir = self.output_dir / "sessions"
-        self.conversation.save_session(session_dir)
+        future = self.conversation.save_session(session_dir)
+        future.add_done_callback(
+            lambda done: self._on_session_save_done(done, session_dir)
+        )
+        return future
+
+    def _on_session_save_done(self, future: Future, session_dir: Path):
+        """Log a failed session write."""
+        error = future.exception()
+        if error is not None:
+            self.logger.error(f"Failed to save session to {session_dir}: {error}")
+
+    def _write_spec_async(self, spec_file: Path, spec_dict: Dict[str, Any]) -> Future:
+        """
+        Write a spec file on the background I/O thread.
+
+        The spec is serialized immediately, so later changes to spec_dict do not
+        leak into the file. The file is guaranteed to be on disk only after the
+        returned future completes, flush_spec_writes() or close().
+
+        Args:
+            spec_file: Output file path
+            spec_dict: Design specification dictionary
+
+        Returns:
+            Future that completes once the file is written
+        """
+        payload = dumps_bytes(spec_dict)
+        future = self._io_pool.submit(spec_file.write_bytes, payload)
+        with self._pending_lock:
+            self._pending_spec_writes.append(future)
+        future.add_done_callback(
+            lambda done: self._on_spec_write_done(done, spec_file)
+        )
+        return future
+
+    def _on_spec_write_done(self, future: Future, spec_file: Path):
+        """Log a failed spec write; forget successful ones."""
+        error = future.exception()
+        if error is not None:
+            self.logger.error(f"Failed to write spec file {spec_file}: {error}")
+            return
+        with self._pending_lock:
+            if future in self._pending_spec_writes:
+                self._pending_spec_writes.remove(future)
+
+    def flush_spec_writes(self):
+        """
+        Block until every scheduled spec file write has finished.
+
+        Raises:
+            Exception: The first error raised by a failed write since the last flush
+        """
+        with self._pending_lock:
+            pending, self._pending_spec_writes = self._pending_spec_writes, []
+
+        first_error = None
+        for future in pending:
+            error = future.exception()
+            if error is not None and first_error is None:
+                first_error = error
+        if first_error is not None:
+            raise first_error
+
+    def close(self):
+        """Flush pending spec and session writes."""
+        self._io_pool.shutdown(wait=True)
+        self.conversation.close()
 
     def reset(self):
         """Reset orchestrator to initial state."""
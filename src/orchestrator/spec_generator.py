@@ -4,15 +4,151 @@ Spec Generator for Orchestrator Agent.
 Converts natural language descriptions into structured DesignSpec JSON.
 """
 
-from typing import Dict, Any, Optional, List
+from functools import cached_property
+from typing import Dict, Any, Optional, List, Union
 from pathlib import Path
-import json
+import asyncio
+import atexit
 import os
-from anthropic import Anthropic
+import re
+import time
+import weakref
+from anthropic import Anthropic, AsyncAnthropic, DefaultAsyncHttpxClient, DefaultHttpxClient
 from pydantic import ValidationError
 
 from ..models.design_spec import DesignSpec
-from ..skills.schema_validator import SchemaValidator
+from ..skills.schema_validator import DesignSpecValidator as SchemaValidator
+from ..utils.json_io import dumps, loads, read_json
+from ..utils.json_patch import JsonPatchError, apply_patch
+
+
+# Fenced ```json ... ``` block in a model response
+_JSON_FENCE_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+
+# Connection pool shared by every SpecGenerator's sync client
+_HTTP_CLIENT: Optional[DefaultHttpxClient] = None
+
+
+def _get_http_client() -> DefaultHttpxClient:
+    """
+    Get the shared HTTP client, creating it on first use.
+
+    Sharing one pool keeps TLS connections alive across generator
+    instances instead of reconnecting for each one.
+
+    Returns:
+        Shared HTTP client
+    """
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = DefaultHttpxClient()
+        atexit.register(_HTTP_CLIENT.close)
+    return _HTTP_CLIENT
+
+
+# Async connection pools shared by every SpecGenerator, one per event loop:
+# pooled connections belong to the loop that opened them
+_ASYNC_HTTP_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, DefaultAsyncHttpxClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_async_http_client() -> DefaultAsyncHttpxClient:
+    """
+    Get the running event loop's shared async HTTP client, creating it on first use.
+
+    Returns:
+        Async HTTP client bound to the running loop
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_HTTP_CLIENTS.get(loop)
+    if client is None:
+        client = _ASYNC_HTTP_CLIENTS[loop] = DefaultAsyncHttpxClient()
+    return client
+
+
+async def _close_async_http_client() -> None:
+    """Close and forget the running loop's async HTTP client, if any."""
+    client = _ASYNC_HTTP_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+# (name, type, closed outline) for generate_example_spec
+_EXAMPLE_ROOMS = (
+    ("거실", "living_room", ((0, 0), (6, 0), (6, 4), (0, 4), (0, 0))),
+    ("침실", "bedroom", ((6, 0), (10, 0), (10, 3), (6, 3), (6, 0))),
+    ("주방", "kitchen", ((0, 4), (4, 4), (4, 6), (0, 6), (0, 4))),
+)
+
+
+class _JsonObjectScanner:
+    """
+    Finds the first complete top-level JSON object in streamed text.
+
+    Tracks brace depth outside of string literals so a stream can be
+    stopped as soon as the spec object closes.
+    """
+
+    __slots__ = ('buffer', 'length', 'depth', 'start', 'in_string', 'escape')
+
+    def __init__(self):
+        self.buffer: List[str] = []
+        self.length = 0
+        self.depth = 0
+        self.start = -1
+        self.in_string = False
+        self.escape = False
+
+    def feed(self, chunk: str) -> Optional[Any]:
+        """
+        Consume a chunk of streamed text.
+
+        Args:
+            chunk: Next piece of the response text
+
+        Returns:
+            Parsed object once a complete top-level object has been seen,
+            otherwise None
+        """
+        offset = self.length
+        self.buffer.append(chunk)
+        self.length += len(chunk)
+
+        for i, char in enumerate(chunk):
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif char == '\\':
+                    self.escape = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                if self.depth:
+                    self.in_string = True
+            elif char == '{':
+                if self.depth == 0:
+                    self.start = offset + i
+                self.depth += 1
+            elif char == '}' and self.depth:
+                self.depth -= 1
+                if self.depth == 0:
+                    text = ''.join(self.buffer)
+                    try:
+                        return loads(text[self.start:offset + i + 1])
+                    except ValueError:
+                        # Braces in prose, keep looking
+                        self.start = -1
+
+        return None
+
+    @property
+    def text(self) -> str:
+        """Everything received so far."""
+        return ''.join(self.buffer)
 
 
 class SpecGenerator:
@@ -26,11 +162,37 @@ class SpecGenerator:
     - Refine specs based on feedback
     """
 
+    # Inputs shorter than this (with no conversation context) go to the simple model
+    SIMPLE_INPUT_MAX_CHARS = 200
+
+    # Signs that a short request still describes several rooms or floors:
+    # counts ("3 bedrooms", "2층"), unit layouts (3LDK), whole-building words
+    MULTI_ROOM_PATTERN = re.compile(
+        r"\d|\b(?:s?ldk|floors?|stor(?:e?y|ies|eys)|apartments?|house|villa|"
+        r"duplex|units?|rooms|bedrooms|bathrooms|layout)\b|층|아파트|주택|빌라|세대",
+        re.IGNORECASE
+    )
+
+    # Room-type words; naming two or more of these means a multi-room request
+    ROOM_WORD_PATTERN = re.compile(
+        r"\b(?:living|bed|bath|dining|guest)?room\b|\b(?:bedroom|bathroom|kitchen|"
+        r"study|office|storage|hallway|corridor|balcony|utility|entrance|garage|"
+        r"toilet)\b|거실|침실|안방|주방|부엌|욕실|화장실|서재|현관|발코니|베란다",
+        re.IGNORECASE
+    )
+
+    # Retries for rate limits (429), overload/5xx and connection errors; the
+    # SDK backs off exponentially with jitter and honours retry-after
+    MAX_RETRIES = 5
+
     def __init__(
         self,
         schema_path: Path,
         api_key: Optional[str] = None,
-        model: str = "claude-3-5-sonnet-20241022"
+        model: str = "claude-3-5-sonnet-20241022",
+        schema: Optional[Dict[str, Any]] = None,
+        simple_model: Optional[str] = "claude-3-5-haiku-20241022",
+        max_retries: int = MAX_RETRIES
     ):
         """
         Initialize spec generator.
@@ -39,20 +201,62 @@ class SpecGenerator:
             schema_path: Path to JSON schema file
             api_key: Anthropic API key (or from environment)
             model: Claude model to use
+            schema: Already-parsed schema (skips reading schema_path)
+            simple_model: Faster model for short, context-free requests
+                (None to always use model)
+            max_retries: Retries for transient API errors (validation
+                failures are never retried)
         """
         self.schema_path = Path(schema_path)
         self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
         self.model = model
+        self.simple_model = simple_model
 
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not found in environment or provided")
 
-        self.client = Anthropic(api_key=self.api_key)
-        self.validator = SchemaValidator(schema_path)
+        self.client = Anthropic(
+            api_key=self.api_key,
+            max_retries=max_retries,
+            http_client=_get_http_client()
+        )
+        self.max_retries = max_retries
+        # Async clients per event loop: pooled connections belong to the loop
+        # that opened them and break once it closes (generate_batch runs a
+        # fresh loop per call)
+        self._aclients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncAnthropic]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        # Load schema for context (once, shared with the validator)
+        if schema is None:
+            schema = read_json(self.schema_path)
+        self.schema = schema
+        self.validator = SchemaValidator(schema_path, schema=schema)
+
+    @property
+    def aclient(self) -> AsyncAnthropic:
+        """
+        Async client for the running event loop, created on first use in that loop.
+
+        Raises:
+            RuntimeError: If called outside a running event loop
+        """
+        loop = asyncio.get_running_loop()
+        client = self._aclients.get(loop)
+        if client is None:
+            client = AsyncAnthropic(
+                api_key=self.api_key,
+                max_retries=self.max_retries,
+                http_client=_get_async_http_client()
+            )
+            self._aclients[loop] = client
+        return client
 
-        # Load schema for context
-        with open(self.schema_path, 'r', encoding='utf-8') as f:
-            self.schema = json.load(f)
+    async def _close_loop_client(self) -> None:
+        """Forget the running loop's async client and close its pool (before the loop closes)."""
+        self._aclients.pop(asyncio.get_running_loop(), None)
+        await _close_async_http_client()
 
     def _build_system_prompt(self) -> str:
         """
@@ -61,23 +265,35 @@ class SpecGenerator:
         Returns:
             System prompt string
         """
-        return """You are an expert architectural design assistant. Your role is to convert natural language descriptions of buildings and spaces into structured JSON specifications following the DesignSpec schema.
+        return """You convert natural-language building descriptions into DesignSpec JSON (schema below).
 
-Key responsibilities:
-1. Extract spatial requirements (rooms, dimensions, layout)
-2. Identify design elements (doors, windows, furniture)
-3. Capture project metadata (name, client, requirements)
-4. Generate valid, complete JSON specifications
-5. Ask clarifying questions when requirements are ambiguous
-
-Design principles:
-- All dimensions are in METERS
-- Coordinates use [x, y] format
-- Polygons must be CLOSED (first point == last point)
+Rules:
+- Units: meters; coordinates [x, y]; room polygons closed (first point == last point)
 - Room types: living_room, bedroom, kitchen, bathroom, etc.
-- Door/window placement uses wall_index (0=bottom, 1=right, 2=top, 3=left)
+- Doors/windows: wall_index 0=bottom, 1=right, 2=top, 3=left
+- Capture project_info, floors, rooms, doors, windows, furniture
+- Fill gaps with reasonable assumptions
+- Output only valid JSON that follows the schema"""
+
+    @cached_property
+    def _system_blocks(self) -> List[Dict[str, Any]]:
+        """
+        System prompt and schema as content blocks, built once per generator.
+
+        The cache breakpoint sits on the last block, so Anthropic prompt caching
+        covers the whole static prefix (instructions + schema) across calls.
 
-Always respond with valid JSON that strictly follows the schema. If information is missing, make reasonable assumptions or ask for clarification."""
+        Returns:
+            System content blocks for messages.create
+        """
+        return [
+            {"type": "text", "text": self._build_system_prompt()},
+            {
+                "type": "text",
+                "text": "DesignSpec JSON schema:\n" + dumps(self.schema),
+                "cache_control": {"type": "ephemeral"}
+            }
+        ]
 
     def _build_generation_prompt(
         self,
@@ -94,46 +310,23 @@ Always respond with valid JSON that strictly follows the schema. If information
         Returns:
             Formatted prompt
         """
-        prompt_parts = [
-            "Please convert the following architectural design requirements into a valid DesignSpec JSON:",
-            "",
-            f"User Requirements:\n{user_input}",
-            ""
-        ]
+        prompt_parts = [f"Requirements:\n{user_input}"]
 
         if context:
-            prompt_parts.extend([
-                "Additional Context:",
-                json.dumps(context, indent=2),
-                ""
-            ])
-
-        prompt_parts.extend([
-            "Generate a complete DesignSpec JSON that includes:",
-            "1. project_info (name, description, client)",
-            "2. building with floors",
-            "3. Each floor with rooms",
-            "4. Each room with:",
-            "   - geometry (polygon coordinates in meters)",
-            "   - doors (with wall_index and position)",
-            "   - windows (with wall_index, position, dimensions)",
-            "   - furniture (optional)",
-            "",
-            "Important:",
-            "- All coordinates in METERS",
-            "- Polygons MUST be closed (first point == last point)",
-            "- Use realistic dimensions for Korean residential spaces",
-            "- Place doors/windows logically on appropriate walls",
-            "",
-            "Respond with ONLY the JSON, no additional text."
-        ])
-
-        return "\n".join(prompt_parts)
+            prompt_parts.append(f"Context:\n{dumps(context)}")
+
+        prompt_parts.append(
+            "Return the complete DesignSpec JSON. Use realistic Korean residential "
+            "dimensions and place doors/windows on sensible walls."
+        )
+
+        return "\n\n".join(prompt_parts)
 
     def _build_refinement_prompt(
         self,
         current_spec: Dict[str, Any],
-        feedback: str
+        feedback: str,
+        delta: bool = True
     ) -> str:
         """
         Build prompt for refining existing spec.
@@ -141,24 +334,37 @@ Always respond with valid JSON that strictly follows the schema. If information
         Args:
             current_spec: Current design specification
             feedback: User feedback for refinement
+            delta: Ask for a JSON Patch instead of the complete spec
 
         Returns:
             Formatted prompt
         """
-        return f"""Here is the current design specification:
+        if delta:
+            instruction = (
+                "Apply the feedback and return only an RFC 6902 JSON Patch array "
+                "(op/path/value, JSON Pointer paths) that transforms the current spec."
+            )
+        else:
+            instruction = (
+                "Apply the feedback, keep everything else unchanged, "
+                "and return the complete updated JSON."
+            )
 
-{json.dumps(current_spec, indent=2, ensure_ascii=False)}
+        # Compact JSON: indentation alone roughly doubles the spec's token count
+        return f"""Current DesignSpec:
+{dumps(current_spec)}
 
-User Feedback:
+Feedback:
 {feedback}
 
-Please update the specification based on this feedback. Maintain all existing data unless specifically requested to change it. Respond with the complete updated JSON."""
+{instruction}"""
 
     def generate_from_text(
         self,
         user_input: str,
         context: Optional[Dict[str, Any]] = None,
-        max_tokens: int = 8000
+        max_tokens: int = 8000,
+        force_model: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Generate DesignSpec JSON from natural language.
@@ -167,6 +373,7 @@ Please update the specification based on this feedback. Maintain all existing da
             user_input: Natural language description
             context: Optional context from conversation
             max_tokens: Maximum tokens for response
+            force_model: Model to use instead of the automatic choice
 
         Returns:
             Generated design specification as dictionary
@@ -175,37 +382,191 @@ Please update the specification based on this feedback. Maintain all existing da
             ValueError: If generation fails or JSON is invalid
         """
         prompt = self._build_generation_prompt(user_input, context)
+        model = force_model or self._select_model(user_input, context)
 
         try:
-            # Call Claude API
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=max_tokens,
-                system=self._build_system_prompt(),
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
+            # Call Claude API, stopping as soon as the spec object is complete
+            spec_json = self._stream_json(self._request_params(prompt, max_tokens, model))
+            return self._validate_spec(spec_json, "Generated")
 
-            # Extract JSON from response
-            response_text = response.content[0].text
-            spec_json = self._extract_json(response_text)
+        except Exception as e:
+            raise ValueError(f"Failed to generate spec: {str(e)}")
 
-            # Validate against schema
-            validation_result = self.validator.validate_json(spec_json)
-            if not validation_result['valid']:
-                raise ValueError(f"Generated spec failed validation: {validation_result['errors']}")
+    async def agenerate_from_text(
+        self,
+        user_input: str,
+        context: Optional[Dict[str, Any]] = None,
+        max_tokens: int = 8000,
+        force_model: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate DesignSpec JSON from natural language without blocking the event loop.
+
+        Args:
+            user_input: Natural language description
+            context: Optional context from conversation
+            max_tokens: Maximum tokens for response
+            force_model: Model to use instead of the automatic choice
+
+        Returns:
+            Generated design specification as dictionary
+
+        Raises:
+            ValueError: If generation fails or JSON is invalid
+        """
+        prompt = self._build_generation_prompt(user_input, context)
+        model = force_model or self._select_model(user_input, context)
 
-            return spec_json
+        try:
+            spec_json = await self._astream_json(self._request_params(prompt, max_tokens, model))
+            return self._validate_spec(spec_json, "Generated")
 
         except Exception as e:
             raise ValueError(f"Failed to generate spec: {str(e)}")
 
+    async def agenerate_batch(
+        self,
+        user_inputs: List[str],
+        context: Optional[Dict[str, Any]] = None,
+        concurrency: int = 5,
+        max_tokens: int = 8000
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Generate several specs concurrently.
+
+        Args:
+            user_inputs: Natural language descriptions
+            context: Optional context shared by all requests
+            concurrency: Maximum number of requests in flight
+            max_tokens: Maximum tokens per response
+
+        Returns:
+            One entry per input, in input order: the generated spec, or the
+            exception raised for that input
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _bounded(user_input: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.agenerate_from_text(user_input, context, max_tokens)
+
+        return await asyncio.gather(
+            *(_bounded(user_input) for user_input in user_inputs),
+            return_exceptions=True
+        )
+
+    def generate_batch(
+        self,
+        user_inputs: List[str],
+        context: Optional[Dict[str, Any]] = None,
+        concurrency: int = 5,
+        max_tokens: int = 8000,
+        bulk: bool = False,
+        bulk_timeout: Optional[float] = None
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Generate several specs, concurrently or through the Message Batches API.
+
+        By default the requests run concurrently and return within normal
+        request latency. With bulk=True they go through the Message Batches
+        API instead: half the token cost, but the batch can take minutes to
+        hours (up to 24 hours) to finish, and this call blocks until it does
+        or bulk_timeout expires.
+
+        Args:
+            user_inputs: Natural language descriptions
+            context: Optional context shared by all requests
+            concurrency: Maximum number of requests in flight (concurrent path)
+            max_tokens: Maximum tokens per response
+            bulk: Use the Message Batches API
+            bulk_timeout: Seconds to wait for a bulk batch (None waits until it ends)
+
+        Returns:
+            One entry per input: the generated spec, or the exception raised
+
+        Raises:
+            TimeoutError: If a bulk batch does not finish within bulk_timeout
+        """
+        if bulk:
+            return self.generate_bulk(user_inputs, context, max_tokens, timeout=bulk_timeout)
+
+        async def _run() -> List[Union[Dict[str, Any], Exception]]:
+            try:
+                return await self.agenerate_batch(user_inputs, context, concurrency, max_tokens)
+            finally:
+                # asyncio.run closes the loop next; its connections go with it
+                await self._close_loop_client()
+
+        return asyncio.run(_run())
+
+    def generate_bulk(
+        self,
+        user_inputs: List[str],
+        context: Optional[Dict[str, Any]] = None,
+        max_tokens: int = 8000,
+        poll_interval: float = 10.0,
+        timeout: Optional[float] = None
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Generate specs through the Message Batches API and wait for the results.
+
+        Args:
+            user_inputs: Natural language descriptions
+            context: Optional context shared by all requests
+            max_tokens: Maximum tokens per response
+            poll_interval: Seconds between batch status checks
+            timeout: Give up (and cancel the batch) after this many seconds
+
+        Returns:
+            One entry per input, in input order: the generated spec, or a
+            ValueError describing why that request failed
+
+        Raises:
+            TimeoutError: If the batch has not ended within timeout
+        """
+        batch = self.client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": f"spec_{i}",
+                    "params": self._request_params(
+                        self._build_generation_prompt(user_input, context),
+                        max_tokens,
+                        self._select_model(user_input, context)
+                    )
+                }
+                for i, user_input in enumerate(user_inputs)
+            ]
+        )
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while batch.processing_status != "ended":
+            if deadline is not None and time.monotonic() >= deadline:
+                self.client.messages.batches.cancel(batch.id)
+                raise TimeoutError(f"Spec batch {batch.id} did not finish within {timeout}s")
+            time.sleep(poll_interval)
+            batch = self.client.messages.batches.retrieve(batch.id)
+
+        results: List[Union[Dict[str, Any], Exception]] = [
+            ValueError("No result returned for request") for _ in user_inputs
+        ]
+        for entry in self.client.messages.batches.results(batch.id):
+            index = int(entry.custom_id.split('_', 1)[1])
+            if entry.result.type != "succeeded":
+                results[index] = ValueError(f"Batch request {entry.result.type}")
+                continue
+            try:
+                results[index] = self._parse_response(entry.result.message, "Generated")
+            except Exception as e:
+                results[index] = ValueError(f"Failed to generate spec: {str(e)}")
+
+        return results
+
     def refine_spec(
         self,
         current_spec: Dict[str, Any],
         feedback: str,
-        max_tokens: int = 8000
+        max_tokens: int = 8000,
+        delta: bool = True
     ) -> Dict[str, Any]:
         """
         Refine existing specification based on feedback.
@@ -214,6 +575,8 @@ Please update the specification based on this feedback. Maintain all existing da
             current_spec: Current design specification
             feedback: User feedback
             max_tokens: Maximum tokens for response
+            delta: Request a JSON Patch and apply it locally; falls back to
+                the full spec if the patch cannot be applied
 
         Returns:
             Refined design specification
@@ -221,32 +584,238 @@ Please update the specification based on this feedback. Maintain all existing da
         Raises:
             ValueError: If refinement fails
         """
-        prompt = self._build_refinement_prompt(current_spec, feedback)
+        prompt = self._build_refinement_prompt(current_spec, feedback, delta)
 
         try:
             response = self.client.messages.create(
-                model=self.model,
-                max_tokens=max_tokens,
-                system=self._build_system_prompt(),
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+                **self._request_params(prompt, max_tokens)
+            )
+            return self._parse_response(response, "Refined", base_spec=current_spec)
+
+        except JsonPatchError:
+            if not delta:
+                raise ValueError("Failed to refine spec: response was not a complete spec")
+            return self.refine_spec(
+                current_spec, feedback, max_tokens, delta=False
             )
 
-            response_text = response.content[0].text
-            refined_spec = self._extract_json(response_text)
+        except Exception as e:
+            raise ValueError(f"Failed to refine spec: {str(e)}")
+
+    async def arefine_spec(
+        self,
+        current_spec: Dict[str, Any],
+        feedback: str,
+        max_tokens: int = 8000,
+        delta: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Refine existing specification without blocking the event loop.
+
+        Args:
+            current_spec: Current design specification
+            feedback: User feedback
+            max_tokens: Maximum tokens for response
+            delta: Request a JSON Patch and apply it locally; falls back to
+                the full spec if the patch cannot be applied
 
-            # Validate refined spec
-            validation_result = self.validator.validate_json(refined_spec)
-            if not validation_result['valid']:
-                raise ValueError(f"Refined spec failed validation: {validation_result['errors']}")
+        Returns:
+            Refined design specification
+
+        Raises:
+            ValueError: If refinement fails
+        """
+        prompt = self._build_refinement_prompt(current_spec, feedback, delta)
 
-            return refined_spec
+        try:
+            response = await self.aclient.messages.create(
+                **self._request_params(prompt, max_tokens)
+            )
+            return self._parse_response(response, "Refined", base_spec=current_spec)
+
+        except JsonPatchError:
+            if not delta:
+                raise ValueError("Failed to refine spec: response was not a complete spec")
+            return await self.arefine_spec(
+                current_spec, feedback, max_tokens, delta=False
+            )
 
         except Exception as e:
             raise ValueError(f"Failed to refine spec: {str(e)}")
 
-    def _extract_json(self, text: str) -> Dict[str, Any]:
+    def _select_model(self, user_input: str, context: Optional[Dict[str, Any]]) -> str:
+        """
+        Pick the model for a generation request.
+
+        Only short, single-room requests without conversation context go to
+        the simple model. A request mentioning counts, floors, unit layouts
+        or more than one room type uses the main model however short it is.
+
+        Args:
+            user_input: Natural language description
+            context: Optional context from conversation
+
+        Returns:
+            Model name
+        """
+        if (
+            self.simple_model
+            and not context
+            and len(user_input) < self.SIMPLE_INPUT_MAX_CHARS
+            and self._is_single_room_request(user_input)
+        ):
+            return self.simple_model
+        return self.model
+
+    def _is_single_room_request(self, user_input: str) -> bool:
+        """
+        Check whether a request describes at most one room.
+
+        Args:
+            user_input: Natural language description
+
+        Returns:
+            True if no multi-room signal and at most one room type is found
+        """
+        if self.MULTI_ROOM_PATTERN.search(user_input):
+            return False
+        room_words = {
+            match.lower() for match in self.ROOM_WORD_PATTERN.findall(user_input)
+        }
+        return len(room_words) <= 1
+
+    def _request_params(
+        self,
+        prompt: str,
+        max_tokens: int,
+        model: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build keyword arguments for messages.create (shared by sync and async clients).
+
+        Args:
+            prompt: User prompt
+            max_tokens: Maximum tokens for response
+            model: Model to use (defaults to the main model)
+
+        Returns:
+            Request parameters
+        """
+        return {
+            'model': model or self.model,
+            'max_tokens': max_tokens,
+            'system': self._system_blocks,
+            'messages': [
+                {"role": "user", "content": prompt}
+            ]
+        }
+
+    def _stream_json(self, params: Dict[str, Any]) -> Union[Dict[str, Any], List[Any]]:
+        """
+        Stream a response and return its JSON as soon as the object closes.
+
+        The stream is closed early, so trailing prose is never generated.
+
+        Args:
+            params: Request parameters from _request_params
+
+        Returns:
+            Extracted JSON
+
+        Raises:
+            ValueError: If no valid JSON is found
+        """
+        scanner = _JsonObjectScanner()
+        with self.client.messages.stream(**params) as stream:
+            for chunk in stream.text_stream:
+                spec_json = scanner.feed(chunk)
+                if spec_json is not None:
+                    return spec_json
+        return self._extract_json(scanner.text)
+
+    async def _astream_json(self, params: Dict[str, Any]) -> Union[Dict[str, Any], List[Any]]:
+        """
+        Async variant of _stream_json.
+
+        Args:
+            params: Request parameters from _request_params
+
+        Returns:
+            Extracted JSON
+
+        Raises:
+            ValueError: If no valid JSON is found
+        """
+        scanner = _JsonObjectScanner()
+        async with self.aclient.messages.stream(**params) as stream:
+            async for chunk in stream.text_stream:
+                spec_json = scanner.feed(chunk)
+                if spec_json is not None:
+                    return spec_json
+        return self._extract_json(scanner.text)
+
+    def _parse_response(
+        self,
+        response: Any,
+        label: str,
+        base_spec: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract and validate the spec JSON from a Claude response.
+
+        Args:
+            response: Message returned by the Anthropic client
+            label: Prefix for validation error messages ("Generated"/"Refined")
+            base_spec: Spec to apply the response to when it is a JSON Patch
+
+        Returns:
+            Design specification dictionary
+
+        Raises:
+            ValueError: If no JSON is found or it fails validation
+            JsonPatchError: If the response is a patch that cannot be applied
+        """
+        # Extract JSON from response
+        response_text = response.content[0].text
+        spec_json = self._extract_json(response_text)
+        return self._validate_spec(spec_json, label, base_spec)
+
+    def _validate_spec(
+        self,
+        spec_json: Union[Dict[str, Any], List[Any]],
+        label: str,
+        base_spec: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Apply a patch response if needed and validate the resulting spec.
+
+        Args:
+            spec_json: Extracted JSON (spec object or JSON Patch array)
+            label: Prefix for validation error messages ("Generated"/"Refined")
+            base_spec: Spec to apply the response to when it is a JSON Patch
+
+        Returns:
+            Design specification dictionary
+
+        Raises:
+            ValueError: If the spec fails validation
+            JsonPatchError: If the response is a patch that cannot be applied
+        """
+        if isinstance(spec_json, list):
+            if base_spec is None:
+                raise ValueError(f"{label} response is a patch, expected a spec")
+            spec_json = apply_patch(base_spec, spec_json)
+        elif not isinstance(spec_json, dict):
+            raise JsonPatchError(f"{label} response is neither a spec nor a patch")
+
+        # Validate against schema
+        is_valid, errors = self.validator.validate_json(spec_json)
+        if not is_valid:
+            raise ValueError(f"{label} spec failed validation: {errors}")
+
+        return spec_json
+
+    def _extract_json(self, text: str) -> Union[Dict[str, Any], List[Any]]:
         """
         Extract JSON from text response.
 
@@ -254,35 +823,40 @@ Please update the specification based on this feedback. Maintain all existing da
             text: Text potentially containing JSON
 
         Returns:
-            Extracted JSON as dictionary
+            Extracted JSON object (spec) or array (patch)
 
         Raises:
             ValueError: If no valid JSON found
         """
-        # Try to parse entire text as JSON
+        # Try to parse entire text as JSON (decode errors are ValueErrors
+        # for both orjson and the json fallback)
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+            return loads(text)
+        except ValueError:
             pass
 
         # Try to find JSON block between ```json and ```
-        import re
-        json_pattern = r'```json\s*(.*?)\s*```'
-        matches = re.findall(json_pattern, text, re.DOTALL)
-        if matches:
+        match = _JSON_FENCE_RE.search(text)
+        if match:
             try:
-                return json.loads(matches[0])
-            except json.JSONDecodeError:
+                return loads(match.group(1))
+            except ValueError:
                 pass
 
-        # Try to find any JSON-like structure
-        brace_start = text.find('{')
-        brace_end = text.rfind('}')
-        if brace_start != -1 and brace_end != -1:
-            try:
-                return json.loads(text[brace_start:brace_end + 1])
-            except json.JSONDecodeError:
-                pass
+        # Try to find any JSON-like structure: an object (spec) or an array
+        # (patch), whichever opens first
+        brackets = [('{', '}'), ('[', ']')]
+        if -1 < text.find('[') < text.find('{') or text.find('{') == -1:
+            brackets.reverse()
+
+        for open_char, close_char in brackets:
+            start = text.find(open_char)
+            end = text.rfind(close_char)
+            if start != -1 and end > start:
+                try:
+                    return loads(text[start:end + 1])
+                except ValueError:
+                    pass
 
         raise ValueError("Could not extract valid JSON from response")
 
@@ -314,40 +888,14 @@ Please update the specification based on this feedback. Maintain all existing da
         Returns:
             Example design specification
         """
-        example = {
-            "project_info": {
-                "name": "Example Project",
-                "description": f"Example {room_count}-room apartment",
-                "client": "Example Client",
-                "location": "Seoul, South Korea",
-                "requirements": ["Natural lighting", "Open layout"]
-            },
-            "building": {
-                "floors": [
-                    {
-                        "level": 1,
-                        "name": "Ground Floor",
-                        "height": 2.8,
-                        "rooms": []
-                    }
-                ]
-            }
-        }
-
-        # Add example rooms
-        room_configs = [
-            ("거실", "living_room", [[0, 0], [6, 0], [6, 4], [0, 4], [0, 0]]),
-            ("침실", "bedroom", [[6, 0], [10, 0], [10, 3], [6, 3], [6, 0]]),
-            ("주방", "kitchen", [[0, 4], [4, 4], [4, 6], [0, 6], [0, 4]]),
-        ]
-
-        for i, (name, room_type, coords) in enumerate(room_configs[:room_count]):
-            room = {
+        # Built fresh from the immutable room table, so callers may mutate it
+        rooms = [
+            {
                 "name": name,
                 "type": room_type,
                 "geometry": {
                     "type": "Polygon",
-                    "coordinates": coords
+                    "coordinates": [list(point) for point in outline]
                 },
                 "doors": [
                     {
@@ -360,6 +908,25 @@ Please update the specification based on this feedback. Maintain all existing da
                 "windows": [],
                 "furniture": []
             }
-            example["building"]["floors"][0]["rooms"].append(room)
+            for name, room_type, outline in _EXAMPLE_ROOMS[:room_count]
+        ]
 
-        return example
+        return {
+            "project_info": {
+                "name": "Example Project",
+                "description": f"Example {room_count}-room apartment",
+                "client": "Example Client",
+                "location": "Seoul, South Korea",
+                "requirements": ["Natural lighting", "Open layout"]
+            },
+            "building": {
+                "floors": [
+                    {
+                        "level": 1,
+                        "name": "Ground Floor",
+                        "height": 2.8,
+                        "rooms": rooms
+                    }
+                ]
+            }
+        }
@@ -6,11 +6,16 @@ Distributes tasks to appropriate implementation agents based on design spec.
 
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
-from enum import Enum
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from enum import Enum, IntEnum
 import json
+import os
+import threading
 
 from ..models.design_spec import DesignSpec
 from ..agents.autocad_agent import AutoCADAgent
+from ..skills.schema_validator import DesignSpecValidator
 
 
 class AgentType(Enum):
@@ -24,9 +29,22 @@ class AgentType(Enum):
     COMPLIANCE = "compliance"
 
 
+class TaskStatus(IntEnum):
+    """Task lifecycle states."""
+    PENDING = 0
+    RUNNING = 1
+    COMPLETED = 2
+    FAILED = 3
+
+
 class Task:
     """Represents a task to be executed by an agent."""
 
+    __slots__ = (
+        'task_id', 'agent_type', 'action', 'parameters', 'priority',
+        'dependencies', 'status', 'result', 'error'
+    )
+
     def __init__(
         self,
         task_id: str,
@@ -42,7 +60,7 @@ class Task:
         self.parameters = parameters
         self.priority = priority
         self.dependencies = dependencies or []
-        self.status = "pending"  # pending, running, completed, failed
+        self.status = TaskStatus.PENDING
         self.result: Optional[Any] = None
         self.error: Optional[str] = None
 
@@ -55,7 +73,7 @@ class Task:
             'parameters': self.parameters,
             'priority': self.priority,
             'dependencies': self.dependencies,
-            'status': self.status,
+            'status': self.status.name.lower(),
             'result': self.result,
             'error': self.error
         }
@@ -76,7 +94,8 @@ class TaskDistributor:
     def __init__(
         self,
         schema_path: Path,
-        output_dir: Optional[Path] = None
+        output_dir: Optional[Path] = None,
+        schema: Optional[Dict[str, Any]] = None
     ):
         """
         Initialize task distributor.
@@ -84,55 +103,90 @@ class TaskDistributor:
         Args:
             schema_path: Path to JSON schema file
             output_dir: Directory for output files
+            schema: Already-parsed schema (skips reading schema_path)
         """
         self.schema_path = Path(schema_path)
+        self.schema = schema
         self.output_dir = Path(output_dir) if output_dir else Path("./output")
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize available agents
-        self.agents: Dict[AgentType, Any] = {}
+        # Available agent classes; instances are created per task
+        self.agents: Dict[AgentType, type] = {}
         self._initialize_agents()
 
         # Task tracking
         self.tasks: List[Task] = []
+        self._task_index: Dict[str, Task] = {}
         self.task_counter = 0
 
+        # Validated specs for generated tasks, so execution can skip
+        # rebuilding them from parameters['design_spec']
+        self._spec_models: Dict[str, DesignSpec] = {}
+
+        # Validation is read-only, so one validator (and its compiled schema)
+        # is shared by the per-task agents on every worker thread
+        self._validator: Optional[DesignSpecValidator] = None
+        self._validator_lock = threading.Lock()
+
     def _initialize_agents(self):
         """Initialize available implementation agents."""
         # AutoCAD Agent (always available)
-        self.agents[AgentType.AUTOCAD] = AutoCADAgent(schema_path=self.schema_path)
+        self.agents[AgentType.AUTOCAD] = AutoCADAgent
 
         # Other agents will be initialized when implemented
-        # self.agents[AgentType.REVIT] = RevitAgent(...)
-        # self.agents[AgentType.RHINO] = RhinoAgent(...)
+        # self.agents[AgentType.REVIT] = RevitAgent
+        # self.agents[AgentType.RHINO] = RhinoAgent
 
-    def analyze_requirements(self, design_spec: DesignSpec) -> List[Task]:
+    def analyze_requirements(
+        self,
+        design_spec: DesignSpec,
+        batch_floors: bool = True
+    ) -> List[Task]:
         """
         Analyze design specification and generate task list.
 
         Args:
             design_spec: Design specification
+            batch_floors: Generate all floor plans in one AutoCAD task
+                (False creates one task per floor, useful for debugging)
 
         Returns:
             List of tasks to execute
         """
         tasks = []
 
+        # Serialized once; every task shares the same read-only dict
+        spec_dict = design_spec.model_dump()
+        floors = design_spec.building.floors
+
         # Task 1: Generate 2D floor plans (AutoCAD)
-        for floor in design_spec.building.floors:
-            task_id = self._generate_task_id()
-            task = Task(
-                task_id=task_id,
+        if batch_floors and len(floors) > 1:
+            tasks.append(Task(
+                task_id=self._generate_task_id(),
                 agent_type=AgentType.AUTOCAD,
-                action="create_floor_plan",
+                action="create_all_floor_plans",
                 parameters={
-                    "design_spec": design_spec.model_dump(),
-                    "floor_level": floor.level,
-                    "output_path": str(self.output_dir / f"floor_{floor.level}.dxf")
+                    "design_spec": spec_dict,
+                    "floor_levels": [floor.level for floor in floors],
+                    "output_dir": str(self.output_dir)
                 },
                 priority=1
-            )
-            tasks.append(task)
+            ))
+        else:
+            for floor in floors:
+                task_id = self._generate_task_id()
+                task = Task(
+                    task_id=task_id,
+                    agent_type=AgentType.AUTOCAD,
+                    action="create_floor_plan",
+                    parameters={
+                        "design_spec": spec_dict,
+                        "floor_level": floor.level,
+                        "output_path": str(self.output_dir / f"floor_{floor.level}.dxf")
+                    },
+                    priority=1
+                )
+                tasks.append(task)
 
         # Additional tasks will be added as more agents are implemented
         # Example: 3D BIM model (Revit)
@@ -141,8 +195,37 @@ class TaskDistributor:
         #     tasks.append(task)
 
         self.tasks.extend(tasks)
+        self._task_index.update((task.task_id, task) for task in tasks)
+        self._spec_models.update((task.task_id, design_spec) for task in tasks)
         return tasks
 
+    def _get_validator(self) -> Optional[DesignSpecValidator]:
+        """
+        Get the shared spec validator, creating it on first use.
+
+        Returns:
+            Validator, or None if no schema is available
+        """
+        if self._validator is None:
+            with self._validator_lock:
+                if self._validator is None and (
+                    self.schema is not None or self.schema_path.exists()
+                ):
+                    self._validator = DesignSpecValidator(self.schema_path, schema=self.schema)
+        return self._validator
+
+    def _create_autocad_agent(self) -> AutoCADAgent:
+        """
+        Create an AutoCAD agent for one task.
+
+        Each task gets its own agent, and with it its own DXF generator and
+        document, so output never depends on which worker thread ran it.
+
+        Returns:
+            AutoCAD agent sharing the distributor's validator
+        """
+        return AutoCADAgent(validator=self._get_validator())
+
     def _generate_task_id(self) -> str:
         """Generate unique task ID."""
         self.task_counter += 1
@@ -156,6 +239,9 @@ class TaskDistributor:
         """
         Execute all pending tasks.
 
+        Tasks are grouped into dependency levels; the tasks of a level are
+        independent of each other and run concurrently, in priority order.
+
         Returns:
             Dictionary containing execution results
         """
@@ -166,39 +252,109 @@ class TaskDistributor:
             'outputs': []
         }
 
-        # Sort tasks by priority (higher first)
-        sorted_tasks = sorted(self.tasks, key=lambda t: t.priority, reverse=True)
+        pending = [task for task in self.tasks if task.status == TaskStatus.PENDING]
+        levels = self._build_levels(pending)
 
-        for task in sorted_tasks:
-            if task.status != "pending":
-                continue
+        if levels:
+            max_workers = min(max(len(level) for level in levels), (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='task') as executor:
+                for level in levels:
+                    self._execute_level(executor, level, results)
+
+        # Tasks left pending are part of a dependency cycle
+        for task in pending:
+            if task.status == TaskStatus.PENDING:
+                task.status = TaskStatus.FAILED
+                task.error = "Unmet dependencies"
+                results['failed'] += 1
+
+        return results
+
+    def _build_levels(self, tasks: List[Task]) -> List[List[Task]]:
+        """
+        Group tasks into dependency levels (Kahn's algorithm).
+
+        Dependencies outside the given tasks are checked at execution time.
+
+        Args:
+            tasks: Pending tasks
+
+        Returns:
+            Levels in execution order, each sorted by priority (higher first)
+        """
+        task_ids = {task.task_id for task in tasks}
+        indegree: Dict[str, int] = {}
+        dependents: Dict[str, List[Task]] = defaultdict(list)
+
+        for task in tasks:
+            local_deps = [dep_id for dep_id in task.dependencies if dep_id in task_ids]
+            indegree[task.task_id] = len(local_deps)
+            for dep_id in local_deps:
+                dependents[dep_id].append(task)
+
+        levels = []
+        level = [task for task in tasks if indegree[task.task_id] == 0]
+        while level:
+            level.sort(key=lambda t: t.priority, reverse=True)
+            levels.append(level)
+
+            next_level = []
+            for task in level:
+                for dependent in dependents[task.task_id]:
+                    indegree[dependent.task_id] -= 1
+                    if indegree[dependent.task_id] == 0:
+                        next_level.append(dependent)
+            level = next_level
+
+        return levels
+
+    def _execute_level(
+        self,
+        executor: ThreadPoolExecutor,
+        level: List[Task],
+        results: Dict[str, Any]
+    ) -> None:
+        """
+        Run one dependency level concurrently.
 
-            # Check dependencies
+        Task state is only updated on the calling thread.
+
+        Args:
+            executor: Thread pool to run tasks on
+            level: Independent tasks, in priority order
+            results: Execution results to update
+        """
+        runnable = []
+        for task in level:
             if not self._check_dependencies(task):
-                task.status = "failed"
+                task.status = TaskStatus.FAILED
                 task.error = "Unmet dependencies"
                 results['failed'] += 1
                 continue
+            task.status = TaskStatus.RUNNING
+            runnable.append(task)
 
-            # Execute task
+        futures = {executor.submit(self._execute_task, task): task for task in runnable}
+        for future in as_completed(futures):
+            task = futures[future]
             try:
-                task.status = "running"
-                result = self._execute_task(task)
-                task.status = "completed"
-                task.result = result
+                task.result = future.result()
+                task.status = TaskStatus.COMPLETED
                 results['completed'] += 1
+            except Exception as e:
+                task.status = TaskStatus.FAILED
+                task.error = str(e)
+                results['failed'] += 1
+
+        # Report outputs in priority order regardless of completion order
+        for task in runnable:
+            if task.status == TaskStatus.COMPLETED:
                 results['outputs'].append({
                     'task_id': task.task_id,
                     'agent': task.agent_type.value,
                     'action': task.action,
-                    'result': result
+                    'result': task.result
                 })
-            except Exception as e:
-                task.status = "failed"
-                task.error = str(e)
-                results['failed'] += 1
-
-        return results
 
     def _check_dependencies(self, task: Task) -> bool:
         """
@@ -210,12 +366,9 @@ class TaskDistributor:
         Returns:
             True if all dependencies are completed
         """
-        if not task.dependencies:
-            return True
-
         for dep_id in task.dependencies:
-            dep_task = next((t for t in self.tasks if t.task_id == dep_id), None)
-            if not dep_task or dep_task.status != "completed":
+            dep_task = self._task_index.get(dep_id)
+            if dep_task is None or dep_task.status != TaskStatus.COMPLETED:
                 return False
 
         return True
@@ -236,17 +389,33 @@ class TaskDistributor:
         if not self._is_agent_available(task.agent_type):
             raise ValueError(f"Agent {task.agent_type.value} not available")
 
-        agent = self.agents[task.agent_type]
-
         # Execute based on agent type and action
         if task.agent_type == AgentType.AUTOCAD:
-            return self._execute_autocad_task(agent, task)
+            return self._execute_autocad_task(self._create_autocad_agent(), task)
         # Add more agent types as they are implemented
         # elif task.agent_type == AgentType.REVIT:
-        #     return self._execute_revit_task(agent, task)
+        #     return self._execute_revit_task(RevitAgent(...), task)
 
         raise ValueError(f"Unknown agent type: {task.agent_type}")
 
+    def _get_task_spec(self, task: Task) -> DesignSpec:
+        """
+        Get the design spec a task operates on.
+
+        Reuses the already-validated spec for generated tasks; only tasks
+        added by hand need their parameters['design_spec'] dict validated.
+
+        Args:
+            task: Task to resolve
+
+        Returns:
+            Design specification
+        """
+        design_spec = self._spec_models.get(task.task_id)
+        if design_spec is None:
+            design_spec = DesignSpec.model_validate(task.parameters['design_spec'])
+        return design_spec
+
     def _execute_autocad_task(self, agent: AutoCADAgent, task: Task) -> Dict[str, Any]:
         """
         Execute AutoCAD agent task.
@@ -262,8 +431,7 @@ class TaskDistributor:
         params = task.parameters
 
         if action == "create_floor_plan":
-            # Convert dict back to DesignSpec
-            design_spec = DesignSpec(**params['design_spec'])
+            design_spec = self._get_task_spec(task)
 
             # Generate floor plan
             output_path = Path(params['output_path'])
@@ -282,6 +450,31 @@ class TaskDistributor:
                 'status': 'success'
             }
 
+        if action == "create_all_floor_plans":
+            design_spec = self._get_task_spec(task)
+
+            # Validates once, then generates every floor
+            output_paths = agent.create_floor_plans(
+                spec=design_spec,
+                floor_levels=params['floor_levels'],
+                output_dir=Path(params['output_dir'])
+            )
+
+            floors = [
+                {
+                    'floor_level': level,
+                    'output_file': str(output_path),
+                    'analysis': agent.analyze_floor_plan(design_spec, level)
+                }
+                for level, output_path in zip(params['floor_levels'], output_paths)
+            ]
+
+            return {
+                'output_files': [floor['output_file'] for floor in floors],
+                'floors': floors,
+                'status': 'success'
+            }
+
         raise ValueError(f"Unknown AutoCAD action: {action}")
 
     def add_task(
@@ -315,6 +508,7 @@ class TaskDistributor:
             dependencies=dependencies
         )
         self.tasks.append(task)
+        self._task_index[task_id] = task
         return task
 
     def get_task_status(self) -> Dict[str, Any]:
@@ -324,15 +518,8 @@ class TaskDistributor:
         Returns:
             Task status summary
         """
-        status_counts = {
-            'pending': 0,
-            'running': 0,
-            'completed': 0,
-            'failed': 0
-        }
-
-        for task in self.tasks:
-            status_counts[task.status] += 1
+        counts = Counter(task.status for task in self.tasks)
+        status_counts = {status.name.lower(): counts[status] for status in TaskStatus}
 
         return {
             'total': len(self.tasks),
@@ -343,6 +530,8 @@ class TaskDistributor:
     def clear_tasks(self):
         """Clear all tasks."""
         self.tasks.clear()
+        self._task_index.clear()
+        self._spec_models.clear()
         self.task_counter = 0
 
     def get_available_agents(self) -> List[str]:
@@ -1,11 +1,33 @@
 """Skills (functional modules) for LLM-CAD Integration System."""
 
-from .dxf_generator import DXFGenerator
-from .schema_validator import DesignSpecValidator
-from .geometry_engine import GeometryEngine
+import importlib
+
+# Public name -> submodule. Submodules are imported on first attribute access
+# (PEP 562), so using one skill does not pull in ezdxf, jsonschema and shapely.
+_LAZY_IMPORTS = {
+    "DXFGenerator": ".dxf_generator",
+    "DesignSpecValidator": ".schema_validator",
+    "GeometryEngine": ".geometry_engine",
+    "get_default_engine": ".geometry_engine",
+}
 
 __all__ = [
     "DXFGenerator",
     "DesignSpecValidator",
     "GeometryEngine",
+    "get_default_engine",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
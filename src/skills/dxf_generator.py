@@ -4,13 +4,101 @@ Generates AutoCAD DXF files from architectural design specifications using ezdxf
 """
 
 import math
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional, Union
+import numpy as np
 import ezdxf
-from ezdxf.enums import TextEntityAlignment
+from ezdxf.enums import TextEntityAlignment, MTextEntityAlignment
 from ezdxf.gfxattribs import GfxAttribs
 
 from ..models.design_spec import DesignSpec, Room, Door, Window, Furniture
+from .geometry_engine import GeometryEngine
+
+
+# Closed unit rectangle centred on the origin, scaled by half width/depth
+_UNIT_RECTANGLE = np.array([
+    [-1.0, -1.0],
+    [1.0, -1.0],
+    [1.0, 1.0],
+    [-1.0, 1.0],
+    [-1.0, -1.0],
+])
+
+# Default (width, depth, height) of furniture without explicit dimensions
+_DEFAULT_FURNITURE_DIMS = {
+    "bed": (2.0, 1.5, 0.5),
+    "desk": (1.2, 0.6, 0.75),
+    "sofa": (2.0, 0.9, 0.85),
+    "table": (1.5, 0.9, 0.75),
+}
+_GENERIC_FURNITURE_DIMS = (1.0, 1.0, 0.5)
+
+
+def _furniture_block_name(furniture_type: str) -> str:
+    """Name of the block drawing a default-size item of the given type."""
+    if furniture_type in _DEFAULT_FURNITURE_DIMS:
+        return f"FURNITURE_{furniture_type.upper()}"
+    return "FURNITURE_GENERIC"
+
+
+# (unit_dx, unit_dy, length, angle_deg) of a wall segment
+WallFrame = Tuple[float, float, float, float]
+
+
+def _mtext_escape(text: str) -> str:
+    """Escape MTEXT control characters in plain text."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace("{", "\\{")
+        .replace("}", "\\}")
+        .replace("\n", " ")
+    )
+
+
+class _RecordedEntity:
+    """Stand-in for an entity returned by _ModelspaceRecorder; records chained calls."""
+
+    __slots__ = ("calls",)
+
+    def __init__(self, calls: List[Tuple[str, tuple, Dict[str, Any]]]):
+        self.calls = calls
+
+    def __getattr__(self, name: str):
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        return record
+
+
+class _ModelspaceRecorder:
+    """
+    Records add_*() calls made against a modelspace so they can be replayed.
+
+    ezdxf documents are not thread-safe, so room geometry is computed on
+    worker threads against a recorder and the entities are created on the
+    calling thread by replay(), in the original order.
+    """
+
+    def __init__(self):
+        self.ops: List[Tuple[str, tuple, Dict[str, Any], list]] = []
+
+    def __getattr__(self, name: str):
+        if not name.startswith("add_"):
+            raise AttributeError(name)
+
+        def record(*args, **kwargs):
+            chained = []
+            self.ops.append((name, args, kwargs, chained))
+            return _RecordedEntity(chained)
+        return record
+
+    def replay(self, msp) -> None:
+        """Create the recorded entities in a real modelspace."""
+        for name, args, kwargs, chained in self.ops:
+            entity = getattr(msp, name)(*args, **kwargs)
+            for method, chained_args, chained_kwargs in chained:
+                getattr(entity, method)(*chained_args, **chained_kwargs)
 
 
 class DXFGenerator:
@@ -19,14 +107,36 @@ class DXFGenerator:
     Uses ezdxf library (no AutoCAD installation required).
     """
 
-    def __init__(self, wall_thickness: float = 0.2):
+    # Shared entity attributes. ezdxf copies dxfattribs on every add_*()
+    # call, so one prebuilt dict per layer is safe to reuse and cheaper than
+    # a fresh literal or a GfxAttribs per entity.
+    _WALL_ATTRIBS = {"layer": "WALL"}
+    _DOOR_ATTRIBS = {"layer": "DOOR"}
+    _WINDOW_ATTRIBS = {"layer": "WINDOW"}
+    _FURNITURE_ATTRIBS = {"layer": "FURNITURE"}
+    _FURNITURE_LABEL_ATTRIBS = {"layer": "TEXT", "height": 0.2}
+    _ROOM_LABEL_ATTRIBS = {"layer": "TEXT", "height": 0.3}
+
+    # Door arc start relative to the wall angle; any direction other than
+    # "inward" swings outward
+    _SWING_OFFSET = {"inward": 90.0, "outward": -90.0}
+
+    # 1 + cos(turn angle) below this means a near-180 degree turn, where a
+    # miter joint would spike far past the wall
+    MIN_MITER_DENOM = 1e-6
+
+    def __init__(self, wall_thickness: float = 0.2, room_workers: int = 1):
         """
         Initialize DXF Generator.
 
         Args:
             wall_thickness: Default wall thickness in meters
+            room_workers: Threads computing room geometry in create_floor_plan.
+                Entities are still created serially, so this only pays off
+                when the GIL is not the bottleneck (e.g. free-threaded builds)
         """
         self.wall_thickness = wall_thickness
+        self.room_workers = room_workers
         self.doc = None
         self.msp = None
 
@@ -35,6 +145,7 @@ class DXFGenerator:
         self.doc = ezdxf.new(version)
         self.msp = self.doc.modelspace()
         self._setup_layers()
+        self._setup_furniture_blocks()
 
     def _setup_layers(self) -> None:
         """Set up standard CAD layers."""
@@ -55,6 +166,18 @@ class DXFGenerator:
                 linetype=props["linetype"]
             )
 
+    def _setup_furniture_blocks(self) -> None:
+        """Define one block per default furniture size, drawn centred on the origin."""
+        sizes = dict(_DEFAULT_FURNITURE_DIMS)
+        sizes["generic"] = _GENERIC_FURNITURE_DIMS
+
+        for furniture_type, (width, depth, _) in sizes.items():
+            block = self.doc.blocks.new(name=_furniture_block_name(furniture_type))
+            block.add_lwpolyline(
+                (_UNIT_RECTANGLE * (width / 2, depth / 2)).tolist(),
+                dxfattribs=self._FURNITURE_ATTRIBS
+            )
+
     def create_wall(
         self,
         start: Tuple[float, float],
@@ -75,7 +198,7 @@ class DXFGenerator:
         # Calculate perpendicular offset
         dx = end[0] - start[0]
         dy = end[1] - start[1]
-        length = math.sqrt(dx**2 + dy**2)
+        length = math.hypot(dx, dy)
 
         if length == 0:
             return
@@ -92,18 +215,92 @@ class DXFGenerator:
         outer2_end = (end[0] - perp_x, end[1] - perp_y)
 
         # Draw wall lines
-        self.msp.add_line(outer1_start, outer1_end, dxfattribs={"layer": "WALL"})
-        self.msp.add_line(outer2_start, outer2_end, dxfattribs={"layer": "WALL"})
+        self.msp.add_line(outer1_start, outer1_end, dxfattribs=self._WALL_ATTRIBS)
+        self.msp.add_line(outer2_start, outer2_end, dxfattribs=self._WALL_ATTRIBS)
 
         # Draw end caps
-        self.msp.add_line(outer1_start, outer2_start, dxfattribs={"layer": "WALL"})
-        self.msp.add_line(outer1_end, outer2_end, dxfattribs={"layer": "WALL"})
+        self.msp.add_line(outer1_start, outer2_start, dxfattribs=self._WALL_ATTRIBS)
+        self.msp.add_line(outer1_end, outer2_end, dxfattribs=self._WALL_ATTRIBS)
+
+    def create_room_walls(
+        self,
+        coords: Union[List[List[float]], np.ndarray],
+        thickness: Optional[float] = None
+    ) -> None:
+        """
+        Create the walls of a closed room outline as two polylines.
+
+        The wall faces either side of the outline are drawn as one closed
+        polyline each, with mitered corners, instead of four lines per wall.
+
+        Args:
+            coords: Room outline as [x, y] points or an (N, 2) array
+            thickness: Wall thickness (uses default if None)
+        """
+        if thickness is None:
+            thickness = self.wall_thickness
+
+        # Drop zero-length edges and the closing point
+        points = np.asarray(coords, dtype=np.float64)
+        keep = np.ones(len(points), dtype=bool)
+        keep[1:] = np.any(np.diff(points, axis=0) != 0, axis=1)
+        points = points[keep]
+        if len(points) > 1 and np.array_equal(points[0], points[-1]):
+            points = points[:-1]
+        if len(points) < 2:
+            return
+
+        # Unit normal of each edge (edge i runs from point i to point i + 1)
+        edges = np.roll(points, -1, axis=0) - points
+        lengths = np.hypot(edges[:, 0], edges[:, 1])
+        normals = np.column_stack((-edges[:, 1], edges[:, 0])) / lengths[:, None]
+
+        # Offset each corner along the miter of its two edges; where an edge
+        # doubles back on itself, fall back to the edge normal
+        prev_normals = np.roll(normals, 1, axis=0)
+        denom = 1 + np.einsum('ij,ij->i', prev_normals, normals)
+        sharp = denom < self.MIN_MITER_DENOM
+        miters = (prev_normals + normals) / np.where(sharp, 1.0, denom)[:, None]
+        miters[sharp] = normals[sharp]
+
+        offsets = miters * (thickness / 2)
+        side1 = (points + offsets).tolist()
+        side2 = (points - offsets).tolist()
+
+        self.msp.add_lwpolyline(side1, close=True, dxfattribs=self._WALL_ATTRIBS)
+        self.msp.add_lwpolyline(side2, close=True, dxfattribs=self._WALL_ATTRIBS)
+
+    @staticmethod
+    def wall_frame(
+        wall_start: Tuple[float, float],
+        wall_end: Tuple[float, float]
+    ) -> WallFrame:
+        """
+        Compute the direction, length and angle of a wall once.
+
+        Args:
+            wall_start: Wall start point
+            wall_end: Wall end point
+
+        Returns:
+            (unit_dx, unit_dy, length, angle_deg) of the wall
+        """
+        dx = wall_end[0] - wall_start[0]
+        dy = wall_end[1] - wall_start[1]
+        wall_length = math.hypot(dx, dy)
+        return (
+            dx / wall_length,
+            dy / wall_length,
+            wall_length,
+            math.degrees(math.atan2(dy, dx)),
+        )
 
     def create_door(
         self,
         wall_start: Tuple[float, float],
         wall_end: Tuple[float, float],
-        door: Door
+        door: Door,
+        frame: Optional[WallFrame] = None
     ) -> None:
         """
         Create a door opening and swing arc.
@@ -112,19 +309,18 @@ class DXFGenerator:
             wall_start: Wall start point
             wall_end: Wall end point
             door: Door specification
+            frame: Precomputed wall_frame(wall_start, wall_end), if available
         """
-        # Calculate door position along the wall
-        dx = wall_end[0] - wall_start[0]
-        dy = wall_end[1] - wall_start[1]
+        if frame is None:
+            frame = self.wall_frame(wall_start, wall_end)
+        unit_dx, unit_dy, wall_length, wall_angle = frame
 
-        door_center_x = wall_start[0] + dx * door.position
-        door_center_y = wall_start[1] + dy * door.position
+        # Calculate door position along the wall
+        offset = wall_length * door.position
+        door_center_x = wall_start[0] + unit_dx * offset
+        door_center_y = wall_start[1] + unit_dy * offset
 
         # Calculate door opening points
-        wall_length = math.sqrt(dx**2 + dy**2)
-        unit_dx = dx / wall_length
-        unit_dy = dy / wall_length
-
         half_width = door.width / 2
         opening_start = (
             door_center_x - unit_dx * half_width,
@@ -136,15 +332,10 @@ class DXFGenerator:
         )
 
         # Draw door opening (line)
-        self.msp.add_line(opening_start, opening_end, dxfattribs={"layer": "DOOR"})
+        self.msp.add_line(opening_start, opening_end, dxfattribs=self._DOOR_ATTRIBS)
 
         # Draw door swing arc
-        wall_angle = math.degrees(math.atan2(dy, dx))
-
-        if door.swing_direction == "inward":
-            swing_angle = wall_angle + 90
-        else:
-            swing_angle = wall_angle - 90
+        swing_angle = wall_angle + self._SWING_OFFSET.get(door.swing_direction, -90.0)
 
         # Door arc (90 degrees)
         self.msp.add_arc(
@@ -152,14 +343,15 @@ class DXFGenerator:
             radius=door.width,
             start_angle=swing_angle,
             end_angle=swing_angle + 90,
-            dxfattribs={"layer": "DOOR"}
+            dxfattribs=self._DOOR_ATTRIBS
         )
 
     def create_window(
         self,
         wall_start: Tuple[float, float],
         wall_end: Tuple[float, float],
-        window: Window
+        window: Window,
+        frame: Optional[WallFrame] = None
     ) -> None:
         """
         Create a window opening.
@@ -168,18 +360,18 @@ class DXFGenerator:
             wall_start: Wall start point
             wall_end: Wall end point
             window: Window specification
+            frame: Precomputed wall_frame(wall_start, wall_end), if available
         """
-        # Calculate window position along the wall
-        dx = wall_end[0] - wall_start[0]
-        dy = wall_end[1] - wall_start[1]
+        if frame is None:
+            frame = self.wall_frame(wall_start, wall_end)
+        unit_dx, unit_dy, wall_length, _ = frame
 
-        window_center_x = wall_start[0] + dx * window.position
-        window_center_y = wall_start[1] + dy * window.position
+        # Calculate window position along the wall
+        offset = wall_length * window.position
+        window_center_x = wall_start[0] + unit_dx * offset
+        window_center_y = wall_start[1] + unit_dy * offset
 
         # Calculate window opening points
-        wall_length = math.sqrt(dx**2 + dy**2)
-        unit_dx = dx / wall_length
-        unit_dy = dy / wall_length
 
         half_width = window.width / 2
         opening_start = (
@@ -192,7 +384,7 @@ class DXFGenerator:
         )
 
         # Draw window opening (double line for glass)
-        self.msp.add_line(opening_start, opening_end, dxfattribs={"layer": "WINDOW"})
+        self.msp.add_line(opening_start, opening_end, dxfattribs=self._WINDOW_ATTRIBS)
 
         # Draw window sill line (slightly offset)
         perp_x = -unit_dy * 0.05
@@ -201,67 +393,48 @@ class DXFGenerator:
         sill_start = (opening_start[0] + perp_x, opening_start[1] + perp_y)
         sill_end = (opening_end[0] + perp_x, opening_end[1] + perp_y)
 
-        self.msp.add_line(sill_start, sill_end, dxfattribs={"layer": "WINDOW"})
+        self.msp.add_line(sill_start, sill_end, dxfattribs=self._WINDOW_ATTRIBS)
 
     def create_furniture(self, furniture: Furniture) -> None:
         """
         Create a furniture item as a simple rectangle.
 
+        Items without explicit dimensions reference the predefined block for
+        their type; custom-sized items are drawn as a rotated polyline.
+
         Args:
             furniture: Furniture specification
         """
         if not furniture.dimensions:
             # Default dimensions based on furniture type
-            default_dims = {
-                "bed": (2.0, 1.5, 0.5),
-                "desk": (1.2, 0.6, 0.75),
-                "sofa": (2.0, 0.9, 0.85),
-                "table": (1.5, 0.9, 0.75),
-            }
-            width, depth, height = default_dims.get(furniture.type.value, (1.0, 1.0, 0.5))
+            self.msp.add_blockref(
+                _furniture_block_name(furniture.type.value),
+                (furniture.position.x, furniture.position.y),
+                dxfattribs={**self._FURNITURE_ATTRIBS, "rotation": furniture.position.rotation}
+            )
         else:
             width = furniture.dimensions.width or 1.0
             depth = furniture.dimensions.depth or 1.0
 
-        # Create rectangle centered at position
-        half_w = width / 2
-        half_d = depth / 2
-
-        # Rotation
-        angle_rad = math.radians(furniture.position.rotation)
-        cos_a = math.cos(angle_rad)
-        sin_a = math.sin(angle_rad)
-
-        # Rectangle corners before rotation
-        corners = [
-            (-half_w, -half_d),
-            (half_w, -half_d),
-            (half_w, half_d),
-            (-half_w, half_d),
-            (-half_w, -half_d)  # Close the rectangle
-        ]
+            # Rectangle corners centered at the origin (closed)
+            corners = _UNIT_RECTANGLE * (width / 2, depth / 2)
 
-        # Rotate and translate corners
-        rotated_corners = []
-        for x, y in corners:
-            rotated_x = x * cos_a - y * sin_a + furniture.position.x
-            rotated_y = x * sin_a + y * cos_a + furniture.position.y
-            rotated_corners.append((rotated_x, rotated_y))
-
-        # Draw polyline
-        self.msp.add_lwpolyline(
-            rotated_corners,
-            dxfattribs={"layer": "FURNITURE"}
-        )
+            # Rotate all corners at once, then translate to the position
+            rotated_corners = GeometryEngine.rotate_points(
+                corners, (0.0, 0.0), furniture.position.rotation
+            ) + (furniture.position.x, furniture.position.y)
+
+            # Draw polyline
+            self.msp.add_lwpolyline(
+                rotated_corners.tolist(),
+                dxfattribs=self._FURNITURE_ATTRIBS
+            )
 
         # Add label
         if furniture.label:
             self.msp.add_text(
                 furniture.label,
-                dxfattribs={
-                    "layer": "TEXT",
-                    "height": 0.2
-                }
+                dxfattribs=self._FURNITURE_LABEL_ATTRIBS
             ).set_placement(
                 (furniture.position.x, furniture.position.y),
                 align=TextEntityAlignment.MIDDLE_CENTER
@@ -274,33 +447,43 @@ class DXFGenerator:
         Args:
             room: Room specification
         """
-        coords = room.geometry.coordinates
+        # Convert the outline once; walls, openings and the label all read it
+        points = np.ascontiguousarray(room.geometry.coordinates, dtype=np.float64)
 
-        # Ensure the polygon is closed
-        if coords[0] != coords[-1]:
-            coords.append(coords[0])
+        # Ensure the polygon is closed, without modifying the model
+        if not np.array_equal(points[0], points[-1]):
+            points = np.vstack((points, points[:1]))
+        num_walls = len(points) - 1
 
         # Create walls
-        for i in range(len(coords) - 1):
-            start = tuple(coords[i])
-            end = tuple(coords[i + 1])
-            self.create_wall(start, end)
+        self.create_room_walls(points)
+
+        # Wall metadata (start, end, frame), computed once per wall that
+        # hosts an opening and shared by all of its doors and windows
+        wall_meta = {}
+
+        def host_wall(wall_index: int):
+            meta = wall_meta.get(wall_index)
+            if meta is None:
+                wall_start, wall_end = map(tuple, points[wall_index:wall_index + 2].tolist())
+                meta = wall_meta[wall_index] = (
+                    wall_start, wall_end, self.wall_frame(wall_start, wall_end)
+                )
+            return meta
 
         # Create doors
         if room.doors:
             for door in room.doors:
-                if door.wall_index < len(coords) - 1:
-                    wall_start = tuple(coords[door.wall_index])
-                    wall_end = tuple(coords[door.wall_index + 1])
-                    self.create_door(wall_start, wall_end, door)
+                if door.wall_index < num_walls:
+                    wall_start, wall_end, frame = host_wall(door.wall_index)
+                    self.create_door(wall_start, wall_end, door, frame)
 
         # Create windows
         if room.windows:
             for window in room.windows:
-                if window.wall_index < len(coords) - 1:
-                    wall_start = tuple(coords[window.wall_index])
-                    wall_end = tuple(coords[window.wall_index + 1])
-                    self.create_window(wall_start, wall_end, window)
+                if window.wall_index < num_walls:
+                    wall_start, wall_end, frame = host_wall(window.wall_index)
+                    self.create_window(wall_start, wall_end, window, frame)
 
         # Create furniture
         if room.furniture:
@@ -308,16 +491,12 @@ class DXFGenerator:
                 self.create_furniture(furn)
 
         # Add room label
-        # Calculate room center
-        center_x = sum(c[0] for c in coords[:-1]) / (len(coords) - 1)
-        center_y = sum(c[1] for c in coords[:-1]) / (len(coords) - 1)
+        # Calculate room center (vertex mean, excluding the closing point)
+        center_x, center_y = points[:-1].mean(axis=0).tolist()
 
         self.msp.add_text(
             room.name,
-            dxfattribs={
-                "layer": "TEXT",
-                "height": 0.3
-            }
+            dxfattribs=self._ROOM_LABEL_ATTRIBS
         ).set_placement(
             (center_x, center_y),
             align=TextEntityAlignment.MIDDLE_CENTER
@@ -349,11 +528,34 @@ class DXFGenerator:
         self._add_title_block(spec, target_floor)
 
         # Create all rooms
-        for room in target_floor.rooms:
-            self.create_room(room)
+        rooms = target_floor.rooms
+        if self.room_workers > 1 and len(rooms) > 1:
+            # Compute in parallel, then emit serially in room order
+            with ThreadPoolExecutor(max_workers=self.room_workers) as executor:
+                recordings = list(executor.map(self._record_room, rooms))
+            for recording in recordings:
+                recording.replay(self.msp)
+        else:
+            for room in rooms:
+                self.create_room(room)
+
+    def _record_room(self, room: Room) -> _ModelspaceRecorder:
+        """
+        Run create_room against a recorder instead of the document.
+
+        Args:
+            room: Room specification
+
+        Returns:
+            Recorder holding the room's entity calls
+        """
+        worker = DXFGenerator(self.wall_thickness)
+        worker.msp = _ModelspaceRecorder()
+        worker.create_room(room)
+        return worker.msp
 
     def _add_title_block(self, spec: DesignSpec, floor) -> None:
-        """Add title block with project information."""
+        """Add title block with project information as a single MTEXT entity."""
         # Simple title block in upper right
         title_x = 20
         title_y = 15
@@ -364,20 +566,21 @@ class DXFGenerator:
             (spec.project_info.client or "", 0.2),
         ]
 
-        y_offset = title_y
-        for text, height in texts:
-            if text:
-                self.msp.add_text(
-                    text,
-                    dxfattribs={
-                        "layer": "TEXT",
-                        "height": height
-                    }
-                ).set_placement(
-                    (title_x, y_offset),
-                    align=TextEntityAlignment.TOP_LEFT
-                )
-                y_offset -= height * 1.5
+        # One paragraph per line, each with its own inline character height
+        content = "\\P".join(
+            f"\\H{height};{_mtext_escape(text)}" for text, height in texts if text
+        )
+
+        self.msp.add_mtext(
+            content,
+            dxfattribs={
+                "layer": "TEXT",
+                "char_height": texts[0][1]
+            }
+        ).set_location(
+            (title_x, title_y),
+            attachment_point=MTextEntityAlignment.TOP_LEFT
+        )
 
     def save(self, output_path: Path) -> None:
         """
@@ -4,16 +4,126 @@ Provides geometric calculations and operations for architectural design.
 """
 
 import math
-from typing import List, Tuple, Optional
+from functools import lru_cache
+from typing import List, Tuple, Optional, Union
+import numpy as np
 from shapely.geometry import Polygon as ShapelyPolygon, Point
 from shapely.ops import unary_union
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+PolygonLike = Union[List[List[float]], ShapelyPolygon]
+
+
+@lru_cache(maxsize=4096)
+def _polygon_from_points(points: Tuple[Tuple[float, ...], ...]) -> ShapelyPolygon:
+    """Build a Shapely polygon, cached by its vertex tuple."""
+    return ShapelyPolygon(points)
+
+
+def _as_polygon(coordinates: PolygonLike) -> ShapelyPolygon:
+    """
+    Get the Shapely polygon for a coordinate list.
+
+    Polygons are cached by content (Shapely geometries are immutable), so
+    calling several GeometryEngine methods on the same room builds the GEOS
+    geometry once. A prebuilt polygon is returned unchanged.
+
+    Args:
+        coordinates: List of [x, y] coordinate pairs, or a Shapely polygon
+
+    Returns:
+        Shapely polygon
+    """
+    if isinstance(coordinates, ShapelyPolygon):
+        return coordinates
+    return _polygon_from_points(tuple(map(tuple, coordinates)))
+
+
+def _ring_area_centroid(xy: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Signed shoelace area and area centroid of a polygon ring.
+
+    Args:
+        xy: (N, 2) float64 vertices; a closing point is optional
+
+    Returns:
+        (signed_area, centroid_x, centroid_y); the centroid is (0, 0) when
+        the area is zero
+    """
+    n = xy.shape[0]
+    area2 = 0.0
+    cx = 0.0
+    cy = 0.0
+    for i in range(n):
+        j = i + 1 if i + 1 < n else 0
+        cross = xy[i, 0] * xy[j, 1] - xy[j, 0] * xy[i, 1]
+        area2 += cross
+        cx += (xy[i, 0] + xy[j, 0]) * cross
+        cy += (xy[i, 1] + xy[j, 1]) * cross
+    if area2 == 0.0:
+        return 0.0, 0.0, 0.0
+    return area2 / 2.0, cx / (3.0 * area2), cy / (3.0 * area2)
+
+
+def _point_in_ring(px: float, py: float, xy: np.ndarray) -> bool:
+    """
+    Ray-casting point-in-polygon test; points on the boundary are outside.
+
+    Args:
+        px: Point x
+        py: Point y
+        xy: (N, 2) float64 vertices; a closing point is optional
+
+    Returns:
+        True if the point is strictly inside the ring
+    """
+    n = xy.shape[0]
+    inside = False
+    for i in range(n):
+        j = i + 1 if i + 1 < n else 0
+        x0, y0 = xy[i, 0], xy[i, 1]
+        x1, y1 = xy[j, 0], xy[j, 1]
+
+        # On this edge: collinear and within its bounding box
+        if ((x1 - x0) * (py - y0) - (y1 - y0) * (px - x0) == 0.0
+                and min(x0, x1) <= px <= max(x0, x1)
+                and min(y0, y1) <= py <= max(y0, y1)):
+            return False
+
+        if (y0 > py) != (y1 > py):
+            if px < x0 + (py - y0) * (x1 - x0) / (y1 - y0):
+                inside = not inside
+    return inside
+
+
+if NUMBA_AVAILABLE:
+    # Compiled kernels skip GEOS object construction, which dominates for
+    # the small polygons of room outlines
+    _ring_area_centroid = njit(cache=True)(_ring_area_centroid)
+    _point_in_ring = njit(cache=True)(_point_in_ring)
+
+
+def _as_array(coordinates: List[List[float]]) -> np.ndarray:
+    """Convert polygon coordinates to a contiguous (N, 2) float64 array."""
+    return np.ascontiguousarray(coordinates, dtype=np.float64)
+
 
 class GeometryEngine:
-    """Geometric calculations for architectural elements."""
+    """
+    Geometric calculations for architectural elements.
+
+    Polygon arguments accept a list of [x, y] pairs or a prebuilt Shapely
+    polygon; polygons built from coordinate lists are cached and reused.
+    """
 
     @staticmethod
-    def calculate_polygon_area(coordinates: List[List[float]]) -> float:
+    def calculate_polygon_area(coordinates: PolygonLike) -> float:
         """
         Calculate the area of a polygon.
 
@@ -23,11 +133,50 @@ class GeometryEngine:
         Returns:
             Area in square meters
         """
-        poly = ShapelyPolygon(coordinates)
+        if NUMBA_AVAILABLE and not isinstance(coordinates, ShapelyPolygon):
+            area, _, _ = _ring_area_centroid(_as_array(coordinates))
+            return abs(area)
+
+        poly = _as_polygon(coordinates)
         return poly.area
 
     @staticmethod
-    def calculate_polygon_perimeter(coordinates: List[List[float]]) -> float:
+    def calculate_polygon_areas(
+        coords: np.ndarray,
+        offsets: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate the areas of many polygons in one vectorized shoelace pass.
+
+        Args:
+            coords: (N, 2) array of all polygon vertices, concatenated
+            offsets: (R + 1,) array; polygon r spans coords[offsets[r]:offsets[r + 1]]
+
+        Returns:
+            (R,) array of areas in square meters
+        """
+        num_polygons = len(offsets) - 1
+        if num_polygons <= 0 or len(coords) == 0:
+            return np.zeros(max(num_polygons, 0), dtype=np.float64)
+
+        starts = offsets[:-1]
+        ends = offsets[1:]
+
+        # Index of the next vertex, wrapping back to each polygon's first vertex
+        next_idx = np.arange(1, len(coords) + 1)
+        nonempty = ends > starts
+        next_idx[ends[nonempty] - 1] = starts[nonempty]
+
+        x = coords[:, 0]
+        y = coords[:, 1]
+        cross = x * y[next_idx] - x[next_idx] * y
+
+        sums = np.zeros(num_polygons, dtype=np.float64)
+        sums[nonempty] = np.add.reduceat(cross, starts[nonempty])
+        return np.abs(sums) / 2.0
+
+    @staticmethod
+    def calculate_polygon_perimeter(coordinates: PolygonLike) -> float:
         """
         Calculate the perimeter of a polygon.
 
@@ -37,11 +186,11 @@ class GeometryEngine:
         Returns:
             Perimeter in meters
         """
-        poly = ShapelyPolygon(coordinates)
+        poly = _as_polygon(coordinates)
         return poly.length
 
     @staticmethod
-    def calculate_centroid(coordinates: List[List[float]]) -> Tuple[float, float]:
+    def calculate_centroid(coordinates: PolygonLike) -> Tuple[float, float]:
         """
         Calculate the centroid of a polygon.
 
@@ -51,14 +200,20 @@ class GeometryEngine:
         Returns:
             (x, y) centroid coordinates
         """
-        poly = ShapelyPolygon(coordinates)
+        if NUMBA_AVAILABLE and not isinstance(coordinates, ShapelyPolygon):
+            area, cx, cy = _ring_area_centroid(_as_array(coordinates))
+            if area != 0.0:
+                return (cx, cy)
+
+        # Zero-area rings fall back to GEOS' line/point centroid
+        poly = _as_polygon(coordinates)
         centroid = poly.centroid
         return (centroid.x, centroid.y)
 
     @staticmethod
     def is_point_inside_polygon(
         point: Tuple[float, float],
-        coordinates: List[List[float]]
+        coordinates: PolygonLike
     ) -> bool:
         """
         Check if a point is inside a polygon.
@@ -70,7 +225,10 @@ class GeometryEngine:
         Returns:
             True if point is inside polygon
         """
-        poly = ShapelyPolygon(coordinates)
+        if NUMBA_AVAILABLE and not isinstance(coordinates, ShapelyPolygon):
+            return bool(_point_in_ring(float(point[0]), float(point[1]), _as_array(coordinates)))
+
+        poly = _as_polygon(coordinates)
         pt = Point(point)
         return poly.contains(pt)
 
@@ -89,7 +247,7 @@ class GeometryEngine:
         Returns:
             Length in meters
         """
-        return math.sqrt((end[0] - start[0])**2 + (end[1] - start[1])**2)
+        return math.hypot(end[0] - start[0], end[1] - start[1])
 
     @staticmethod
     def calculate_wall_angle(
@@ -129,7 +287,7 @@ class GeometryEngine:
         """
         dx = end[0] - start[0]
         dy = end[1] - start[1]
-        length = math.sqrt(dx**2 + dy**2)
+        length = math.hypot(dx, dy)
 
         if length == 0:
             return (start, end)
@@ -145,7 +303,7 @@ class GeometryEngine:
 
     @staticmethod
     def calculate_bounding_box(
-        coordinates: List[List[float]]
+        coordinates: PolygonLike
     ) -> Tuple[float, float, float, float]:
         """
         Calculate bounding box of a polygon.
@@ -156,12 +314,12 @@ class GeometryEngine:
         Returns:
             (min_x, min_y, max_x, max_y)
         """
-        poly = ShapelyPolygon(coordinates)
+        poly = _as_polygon(coordinates)
         return poly.bounds
 
     @staticmethod
     def simplify_polygon(
-        coordinates: List[List[float]],
+        coordinates: PolygonLike,
         tolerance: float = 0.01
     ) -> List[List[float]]:
         """
@@ -174,14 +332,14 @@ class GeometryEngine:
         Returns:
             Simplified coordinate list
         """
-        poly = ShapelyPolygon(coordinates)
+        poly = _as_polygon(coordinates)
         simplified = poly.simplify(tolerance, preserve_topology=True)
         return list(simplified.exterior.coords)
 
     @staticmethod
     def check_polygon_overlap(
-        coords1: List[List[float]],
-        coords2: List[List[float]]
+        coords1: PolygonLike,
+        coords2: PolygonLike
     ) -> bool:
         """
         Check if two polygons overlap.
@@ -193,14 +351,14 @@ class GeometryEngine:
         Returns:
             True if polygons overlap
         """
-        poly1 = ShapelyPolygon(coords1)
-        poly2 = ShapelyPolygon(coords2)
+        poly1 = _as_polygon(coords1)
+        poly2 = _as_polygon(coords2)
         return poly1.intersects(poly2)
 
     @staticmethod
     def calculate_intersection_area(
-        coords1: List[List[float]],
-        coords2: List[List[float]]
+        coords1: PolygonLike,
+        coords2: PolygonLike
     ) -> float:
         """
         Calculate the intersection area of two polygons.
@@ -212,8 +370,8 @@ class GeometryEngine:
         Returns:
             Intersection area in square meters
         """
-        poly1 = ShapelyPolygon(coords1)
-        poly2 = ShapelyPolygon(coords2)
+        poly1 = _as_polygon(coords1)
+        poly2 = _as_polygon(coords2)
         intersection = poly1.intersection(poly2)
         return intersection.area
 
@@ -249,6 +407,31 @@ class GeometryEngine:
         # Translate back
         return (new_x + center[0], new_y + center[1])
 
+    @staticmethod
+    def rotate_points(
+        points: np.ndarray,
+        center: Tuple[float, float],
+        angle_degrees: float
+    ) -> np.ndarray:
+        """
+        Rotate an array of points around a center in one matrix product.
+
+        Args:
+            points: (N, 2) array of points to rotate
+            center: (x, y) rotation center
+            angle_degrees: Rotation angle in degrees
+
+        Returns:
+            (N, 2) array of rotated points
+        """
+        angle_rad = math.radians(angle_degrees)
+        cos_a = math.cos(angle_rad)
+        sin_a = math.sin(angle_rad)
+        rotation = np.array([[cos_a, -sin_a], [sin_a, cos_a]])
+
+        center_arr = np.asarray(center, dtype=np.float64)
+        return (np.asarray(points, dtype=np.float64) - center_arr) @ rotation.T + center_arr
+
     @staticmethod
     def calculate_door_opening_points(
         wall_start: Tuple[float, float],
@@ -270,7 +453,7 @@ class GeometryEngine:
         """
         dx = wall_end[0] - wall_start[0]
         dy = wall_end[1] - wall_start[1]
-        wall_length = math.sqrt(dx**2 + dy**2)
+        wall_length = math.hypot(dx, dy)
 
         if wall_length == 0:
             return (wall_start, wall_end)
@@ -294,3 +477,21 @@ class GeometryEngine:
         )
 
         return (opening_start, opening_end)
+
+
+_DEFAULT_ENGINE: Optional[GeometryEngine] = None
+
+
+def get_default_engine() -> GeometryEngine:
+    """
+    Get the process-wide shared GeometryEngine instance.
+
+    GeometryEngine holds no per-agent state, so all agents share one instance.
+
+    Returns:
+        Shared GeometryEngine
+    """
+    global _DEFAULT_ENGINE
+    if _DEFAULT_ENGINE is None:
+        _DEFAULT_ENGINE = GeometryEngine()
+    return _DEFAULT_ENGINE
@@ -4,27 +4,102 @@ Validates design specifications against JSON schema.
 """
 
 import json
+from collections import defaultdict
 from pathlib import Path
-from typing import Tuple, List, Dict, Any
-from jsonschema import validate, ValidationError, Draft7Validator
+from typing import Tuple, List, Dict, Any, Optional, Callable
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import best_match
+import numpy as np
 
 from ..models.design_spec import DesignSpec
+from ..utils.json_io import read_json
+
+try:
+    import jsonschema_rs
+    JSONSCHEMA_RS_AVAILABLE = True
+except ImportError:
+    JSONSCHEMA_RS_AVAILABLE = False
+
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+
+# Compiled validators shared by every DesignSpecValidator, keyed by canonical schema JSON
+_VALIDATOR_CACHE: Dict[str, Draft7Validator] = {}
+_FAST_VALIDATOR_CACHE: Dict[str, Optional[Callable[[Any], bool]]] = {}
+
+
+def _get_validator(schema: Dict[str, Any]) -> Draft7Validator:
+    """Return the shared Draft7Validator for a schema, creating it on first use."""
+    key = json.dumps(schema, sort_keys=True)
+    validator = _VALIDATOR_CACHE.get(key)
+    if validator is None:
+        validator = _VALIDATOR_CACHE[key] = Draft7Validator(schema)
+    return validator
+
+
+def _compile_fast_validator(schema: Dict[str, Any]) -> Optional[Callable[[Any], bool]]:
+    """Build a native is_valid check, preferring jsonschema-rs over fastjsonschema."""
+    if JSONSCHEMA_RS_AVAILABLE:
+        try:
+            return jsonschema_rs.Draft7Validator(schema).is_valid
+        except ValueError:
+            pass
+
+    if FASTJSONSCHEMA_AVAILABLE:
+        try:
+            # use_default=False: validation must not fill defaults into the spec
+            fast_validate = fastjsonschema.compile(schema, use_default=False)
+        except fastjsonschema.JsonSchemaDefinitionException:
+            return None
+
+        def is_valid(instance: Any) -> bool:
+            try:
+                fast_validate(instance)
+                return True
+            except fastjsonschema.JsonSchemaException:
+                return False
+
+        return is_valid
+
+    return None
+
+
+def _get_fast_validator(schema: Dict[str, Any]) -> Optional[Callable[[Any], bool]]:
+    """
+    Return the shared native validity check for a schema, compiling it on first use.
+
+    Args:
+        schema: JSON schema
+
+    Returns:
+        Function returning whether an instance is valid, or None if neither
+        jsonschema-rs nor fastjsonschema is installed and able to compile the schema
+    """
+    key = json.dumps(schema, sort_keys=True)
+    if key not in _FAST_VALIDATOR_CACHE:
+        _FAST_VALIDATOR_CACHE[key] = _compile_fast_validator(schema)
+    return _FAST_VALIDATOR_CACHE[key]
 
 
 class DesignSpecValidator:
     """Validates architectural design specifications."""
 
-    def __init__(self, schema_path: Path):
+    def __init__(self, schema_path: Path, schema: Optional[Dict[str, Any]] = None):
         """
         Initialize validator with JSON schema.
 
         Args:
             schema_path: Path to JSON schema file
+            schema: Already-parsed schema (skips reading schema_path)
         """
-        with open(schema_path, 'r', encoding='utf-8') as f:
-            self.schema = json.load(f)
+        self.schema = schema if schema is not None else read_json(Path(schema_path))
 
-        self.validator = Draft7Validator(self.schema)
+        self.validator = _get_validator(self.schema)
+        self._fast_is_valid = _get_fast_validator(self.schema)
 
     def validate_json(self, spec_dict: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -36,20 +111,101 @@ class DesignSpecValidator:
         Returns:
             Tuple of (is_valid, error_messages)
         """
-        errors = []
+        # Native validator for the common valid case; jsonschema produces
+        # the detailed report when it fails
+        if self._fast_is_valid is not None and self._fast_is_valid(spec_dict):
+            return True, []
 
-        try:
-            validate(instance=spec_dict, schema=self.schema)
+        # One schema walk; the headline error is the one jsonschema.validate
+        # would have raised
+        all_errors = list(self.validator.iter_errors(spec_dict))
+        if not all_errors:
             return True, []
-        except ValidationError as e:
-            errors.append(f"Validation error: {e.message}")
-            errors.append(f"Path: {' -> '.join(str(p) for p in e.path)}")
 
-            # Collect all validation errors
-            for error in self.validator.iter_errors(spec_dict):
-                errors.append(f"  - {error.message} at {'.'.join(str(p) for p in error.path)}")
+        primary = best_match(all_errors)
+        errors = [
+            f"Validation error: {primary.message}",
+            f"Path: {' -> '.join(str(p) for p in primary.path)}",
+        ]
 
-            return False, errors
+        # Collect all validation errors
+        for error in all_errors:
+            errors.append(f"  - {error.message} at {'.'.join(str(p) for p in error.path)}")
+
+        return False, errors
+
+    def _check_rooms(self, spec: DesignSpec) -> Tuple[List[str], List[str]]:
+        """
+        Run the model and geometry checks in a single walk over the rooms.
+
+        Args:
+            spec: DesignSpec model instance
+
+        Returns:
+            Tuple of (model_errors, geometry_errors)
+        """
+        closure_errors = []
+        opening_errors = []
+        geometry_errors = []
+
+        # Find degenerate segments (zero-length walls) of every room in one
+        # pass over the flattened coordinates; the pair spanning two rooms
+        # (last point of one, first point of the next) is not a wall
+        coords_all, room_offsets, _ = spec.building.coord_blob()
+        zero_length = np.all(coords_all[1:] == coords_all[:-1], axis=1)
+        zero_length[room_offsets[1:-1] - 1] = False
+
+        degenerate = np.flatnonzero(zero_length)
+        room_of_edge = np.searchsorted(room_offsets, degenerate, side='right') - 1
+        degenerate_by_room = defaultdict(list)
+        for edge, room_index in zip(degenerate.tolist(), room_of_edge.tolist()):
+            degenerate_by_room[room_index].append(edge - int(room_offsets[room_index]))
+
+        room_index = 0
+        for floor in spec.building.floors:
+            for room in floor.rooms:
+                coords = room.geometry.coordinates
+                num_walls = len(coords) - 1
+
+                # Check for closed polygons
+                if coords[0] != coords[-1]:
+                    closure_errors.append(
+                        f"Room '{room.name}' polygon is not closed. "
+                        f"First point {coords[0]} != Last point {coords[-1]}"
+                    )
+
+                # Check door/window indices
+                if room.doors:
+                    for i, door in enumerate(room.doors):
+                        if door.wall_index >= num_walls:
+                            opening_errors.append(
+                                f"Room '{room.name}' door {i}: wall_index {door.wall_index} "
+                                f"exceeds number of walls ({num_walls})"
+                            )
+
+                if room.windows:
+                    for i, window in enumerate(room.windows):
+                        if window.wall_index >= num_walls:
+                            opening_errors.append(
+                                f"Room '{room.name}' window {i}: wall_index {window.wall_index} "
+                                f"exceeds number of walls ({num_walls})"
+                            )
+
+                # Check minimum number of points
+                if len(coords) < 4:  # 3 points + closing point
+                    geometry_errors.append(
+                        f"Room '{room.name}' has insufficient points ({len(coords)}). "
+                        f"Minimum 4 points required (3 + closing point)"
+                    )
+
+                for i in degenerate_by_room.get(room_index, ()):
+                    geometry_errors.append(
+                        f"Room '{room.name}' has zero-length wall segment at index {i}"
+                    )
+
+                room_index += 1
+
+        return closure_errors + opening_errors, geometry_errors
 
     def validate_model(self, spec: DesignSpec) -> Tuple[bool, List[str]]:
         """
@@ -63,47 +219,15 @@ class DesignSpecValidator:
         """
         try:
             # Pydantic models are already validated, but we can add custom checks
-            errors = []
-
-            # Check for closed polygons
-            for floor in spec.building.floors:
-                for room in floor.rooms:
-                    coords = room.geometry.coordinates
-                    if coords[0] != coords[-1]:
-                        errors.append(
-                            f"Room '{room.name}' polygon is not closed. "
-                            f"First point {coords[0]} != Last point {coords[-1]}"
-                        )
-
-            # Check door/window indices
-            for floor in spec.building.floors:
-                for room in floor.rooms:
-                    num_walls = len(room.geometry.coordinates) - 1
-
-                    if room.doors:
-                        for i, door in enumerate(room.doors):
-                            if door.wall_index >= num_walls:
-                                errors.append(
-                                    f"Room '{room.name}' door {i}: wall_index {door.wall_index} "
-                                    f"exceeds number of walls ({num_walls})"
-                                )
-
-                    if room.windows:
-                        for i, window in enumerate(room.windows):
-                            if window.wall_index >= num_walls:
-                                errors.append(
-                                    f"Room '{room.name}' window {i}: wall_index {window.wall_index} "
-                                    f"exceeds number of walls ({num_walls})"
-                                )
-
-            if errors:
-                return False, errors
-
-            return True, []
-
+            errors, _ = self._check_rooms(spec)
         except Exception as e:
             return False, [f"Validation error: {str(e)}"]
 
+        if errors:
+            return False, errors
+
+        return True, []
+
     def validate_geometry(self, spec: DesignSpec) -> Tuple[bool, List[str]]:
         """
         Validate geometric properties of the specification.
@@ -114,27 +238,7 @@ class DesignSpecValidator:
         Returns:
             Tuple of (is_valid, error_messages)
         """
-        errors = []
-
-        for floor in spec.building.floors:
-            for room in floor.rooms:
-                coords = room.geometry.coordinates
-
-                # Check minimum number of points
-                if len(coords) < 4:  # 3 points + closing point
-                    errors.append(
-                        f"Room '{room.name}' has insufficient points ({len(coords)}). "
-                        f"Minimum 4 points required (3 + closing point)"
-                    )
-
-                # Check for degenerate segments (zero-length walls)
-                for i in range(len(coords) - 1):
-                    p1 = coords[i]
-                    p2 = coords[i + 1]
-                    if p1 == p2:
-                        errors.append(
-                            f"Room '{room.name}' has zero-length wall segment at index {i}"
-                        )
+        _, errors = self._check_rooms(spec)
 
         if errors:
             return False, errors
@@ -153,13 +257,17 @@ class DesignSpecValidator:
         """
         all_errors = []
 
-        # Validate model
-        valid_model, model_errors = self.validate_model(spec)
+        # Model and geometry checks share one walk over the rooms
+        try:
+            model_errors, geom_errors = self._check_rooms(spec)
+        except Exception as e:
+            model_errors, geom_errors = [f"Validation error: {str(e)}"], []
+
+        valid_model = not model_errors
         if not valid_model:
             all_errors.extend(["Model validation errors:"] + model_errors)
 
-        # Validate geometry
-        valid_geom, geom_errors = self.validate_geometry(spec)
+        valid_geom = not geom_errors
         if not valid_geom:
             all_errors.extend(["Geometry validation errors:"] + geom_errors)
 
@@ -1 +1,16 @@
 """Utility modules."""
+
+from .json_io import dumps, dumps_bytes, compress_bytes, write_bytes, write_json, loads, read_json
+from .json_patch import JsonPatchError, apply_patch
+
+__all__ = [
+    "dumps",
+    "dumps_bytes",
+    "compress_bytes",
+    "write_bytes",
+    "write_json",
+    "loads",
+    "read_json",
+    "JsonPatchError",
+    "apply_patch",
+]
@@ -0,0 +1,127 @@
+"""
+JSON Patch Utilities
+Applies RFC 6902 JSON Patch documents to parsed JSON objects.
+
+Used for delta refinement, where the model returns only the operations that
+change a design spec instead of the complete document.
+"""
+
+import copy
+from typing import Any, Dict, List, Tuple
+
+
+class JsonPatchError(ValueError):
+    """Raised when a patch operation cannot be applied."""
+
+
+def _parse_pointer(pointer: str) -> List[str]:
+    """Split a JSON Pointer (RFC 6901) into unescaped reference tokens."""
+    if pointer == '':
+        return []
+    if not pointer.startswith('/'):
+        raise JsonPatchError(f"Invalid JSON pointer: {pointer!r}")
+    return [token.replace('~1', '/').replace('~0', '~') for token in pointer[1:].split('/')]
+
+
+def _array_index(container: List[Any], token: str, allow_end: bool) -> int:
+    """Convert a reference token to a list index."""
+    if token == '-' and allow_end:
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token[0] == '0'):
+        raise JsonPatchError(f"Invalid array index: {token!r}")
+    index = int(token)
+    limit = len(container) if allow_end else len(container) - 1
+    if index > limit:
+        raise JsonPatchError(f"Array index out of range: {index}")
+    return index
+
+
+def _resolve_parent(doc: Any, pointer: str) -> Tuple[Any, str]:
+    """Return the container holding the pointer target and the final token."""
+    tokens = _parse_pointer(pointer)
+    if not tokens:
+        raise JsonPatchError("Operation on the document root is not supported")
+
+    parent = doc
+    for token in tokens[:-1]:
+        if isinstance(parent, list):
+            parent = parent[_array_index(parent, token, allow_end=False)]
+        elif isinstance(parent, dict) and token in parent:
+            parent = parent[token]
+        else:
+            raise JsonPatchError(f"Path not found: {pointer}")
+    return parent, tokens[-1]
+
+
+def _get(doc: Any, pointer: str) -> Any:
+    """Return the value at pointer."""
+    parent, token = _resolve_parent(doc, pointer)
+    if isinstance(parent, list):
+        return parent[_array_index(parent, token, allow_end=False)]
+    if isinstance(parent, dict) and token in parent:
+        return parent[token]
+    raise JsonPatchError(f"Path not found: {pointer}")
+
+
+def _add(doc: Any, pointer: str, value: Any) -> None:
+    parent, token = _resolve_parent(doc, pointer)
+    if isinstance(parent, list):
+        parent.insert(_array_index(parent, token, allow_end=True), value)
+    elif isinstance(parent, dict):
+        parent[token] = value
+    else:
+        raise JsonPatchError(f"Cannot add to a scalar at {pointer}")
+
+
+def _remove(doc: Any, pointer: str) -> Any:
+    parent, token = _resolve_parent(doc, pointer)
+    if isinstance(parent, list):
+        return parent.pop(_array_index(parent, token, allow_end=False))
+    if isinstance(parent, dict) and token in parent:
+        return parent.pop(token)
+    raise JsonPatchError(f"Path not found: {pointer}")
+
+
+def apply_patch(doc: Dict[str, Any], patch: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Apply a JSON Patch to a document without modifying the original.
+
+    Supports the add, remove, replace, move, copy and test operations.
+
+    Args:
+        doc: Parsed JSON document
+        patch: List of patch operations
+
+    Returns:
+        Patched copy of the document
+
+    Raises:
+        JsonPatchError: If an operation is malformed or its path does not exist
+    """
+    result = copy.deepcopy(doc)
+
+    for operation in patch:
+        if not isinstance(operation, dict) or 'op' not in operation or 'path' not in operation:
+            raise JsonPatchError(f"Malformed patch operation: {operation!r}")
+
+        op = operation['op']
+        path = operation['path']
+
+        if op == 'add':
+            _add(result, path, copy.deepcopy(operation['value']))
+        elif op == 'remove':
+            _remove(result, path)
+        elif op == 'replace':
+            _remove(result, path)
+            _add(result, path, copy.deepcopy(operation['value']))
+        elif op == 'move':
+            _add(result, path, _remove(result, operation['from']))
+        elif op == 'copy':
+            _add(result, path, copy.deepcopy(_get(result, operation['from'])))
+        elif op == 'test':
+            if _get(result, path) != operation['value']:
+                raise JsonPatchError(f"Test failed at {path}")
+        else:
+            raise JsonPatchError(f"Unsupported patch operation: {op!r}")
+
+    return result
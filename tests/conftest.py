@@ -0,0 +1,54 @@
+"""Shared pytest fixtures."""
+
+import copy
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.models.design_spec import DesignSpec  # noqa: E402
+from src.utils.json_io import read_json  # noqa: E402
+
+FIXTURES_DIR = ROOT / "tests" / "fixtures"
+SCHEMA_PATH = ROOT / "config" / "schemas" / "design_spec.schema.json"
+
+
+@pytest.fixture
+def schema_path() -> Path:
+    return SCHEMA_PATH
+
+
+@pytest.fixture
+def apartment_spec_dict() -> dict:
+    """Single-floor 3LDK apartment (5 rooms)."""
+    return read_json(FIXTURES_DIR / "3ldk_apartment.json")
+
+
+@pytest.fixture
+def simple_spec_dict() -> dict:
+    """Single-floor, single-room spec."""
+    return read_json(FIXTURES_DIR / "simple_room.json")
+
+
+@pytest.fixture
+def two_floor_spec(apartment_spec_dict) -> DesignSpec:
+    """The 3LDK apartment plus a second floor whose room names end in " 2F"."""
+    spec_dict = copy.deepcopy(apartment_spec_dict)
+    floor = copy.deepcopy(spec_dict["building"]["floors"][0])
+    floor["level"] = 2
+    for room in floor["rooms"]:
+        room["name"] = f"{room['name']} 2F"
+    spec_dict["building"]["floors"].append(floor)
+    return DesignSpec(**spec_dict)
+
+
+def room_labels(path) -> set:
+    """Room labels in a DXF file (0.3 m TEXT; furniture labels are 0.2 m)."""
+    import ezdxf
+
+    msp = ezdxf.readfile(path).modelspace()
+    return {text.dxf.text for text in msp.query("TEXT") if text.dxf.height == 0.3}
@@ -0,0 +1,31 @@
+"""Tests for AutoCADAgent floor plan generation."""
+
+import ezdxf
+
+from src.agents.autocad_agent import AutoCADAgent
+from src.models.design_spec import DesignSpec
+
+from conftest import room_labels
+
+
+def test_create_floor_plans_writes_each_floor_on_its_own(two_floor_spec, schema_path, tmp_path):
+    agent = AutoCADAgent(schema_path=schema_path)
+
+    paths = agent.create_floor_plans(two_floor_spec, [1, 2], tmp_path)
+
+    assert [p.name for p in paths] == ["floor_1.dxf", "floor_2.dxf"]
+    for path, floor in zip(paths, two_floor_spec.building.floors):
+        assert room_labels(path) == {room.name for room in floor.rooms}
+        # Exactly one title block per file
+        assert len(ezdxf.readfile(path).modelspace().query("MTEXT")) == 1
+
+
+def test_reused_agent_starts_a_new_document_per_floor_plan(apartment_spec_dict, schema_path, tmp_path):
+    spec = DesignSpec(**apartment_spec_dict)
+    agent = AutoCADAgent(schema_path=schema_path)
+
+    first = agent.create_floor_plan(spec, tmp_path / "first.dxf")
+    second = agent.create_floor_plan(spec, tmp_path / "second.dxf")
+
+    first_count = len(ezdxf.readfile(first).modelspace())
+    assert len(ezdxf.readfile(second).modelspace()) == first_count
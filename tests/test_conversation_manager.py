@@ -0,0 +1,72 @@
+"""Tests for ConversationManager session persistence."""
+
+import pytest
+
+from src.orchestrator.conversation_manager import ConversationManager
+
+
+def _contents(manager):
+    return [message["content"] for message in manager.get_message_dicts()]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_in_memory_session_round_trip(tmp_path, compress):
+    if compress:
+        pytest.importorskip("zstandard")
+    manager = ConversationManager(session_id="s1")
+    manager.add_user_message("3LDK apartment")
+    manager.add_assistant_message("Here is the spec")
+    manager.update_state(phase="refinement", design_spec={"version": "1.0"})
+
+    manager.save_session(tmp_path, compress=compress).result(timeout=10)
+    manager.close()
+
+    suffix = ".json.zst" if compress else ".json"
+    loaded = ConversationManager.load_session(tmp_path / f"s1{suffix}")
+    assert loaded.session_id == "s1"
+    assert _contents(loaded) == ["3LDK apartment", "Here is the spec"]
+    assert loaded.state.phase == "refinement"
+    assert loaded.state.design_spec == {"version": "1.0"}
+
+
+def test_logged_session_loads_from_another_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = ConversationManager(session_id="s1", log_dir="output/logs")
+    manager.add_user_message("a")
+    manager.add_assistant_message("b")
+    manager.save_session("output", compress=False).result(timeout=10)
+    manager.close()
+
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+    loaded = ConversationManager.load_session(tmp_path / "output" / "s1.json")
+    assert _contents(loaded) == ["a", "b"]
+
+    # The reloaded manager keeps appending to the same log
+    loaded.add_user_message("c")
+    loaded.save_session(tmp_path / "output", compress=False).result(timeout=10)
+    loaded.close()
+    assert _contents(ConversationManager.load_session(tmp_path / "output" / "s1.json")) == ["a", "b", "c"]
+
+
+def test_cleared_session_reloads_empty(tmp_path):
+    manager = ConversationManager(session_id="s1", log_dir=tmp_path / "logs")
+    manager.add_user_message("a")
+    manager.clear()
+    manager.save_session(tmp_path, compress=False).result(timeout=10)
+    manager.close()
+
+    assert _contents(ConversationManager.load_session(tmp_path / "s1.json")) == []
+
+
+def test_missing_message_log_raises(tmp_path):
+    manager = ConversationManager(session_id="s1", log_dir=tmp_path / "logs")
+    manager.save_session(tmp_path, compress=False).result(timeout=10)
+    manager.close()
+    assert _contents(ConversationManager.load_session(tmp_path / "s1.json")) == []
+
+    (tmp_path / "logs" / "s1.jsonl").unlink()
+
+    with pytest.raises(FileNotFoundError):
+        ConversationManager.load_session(tmp_path / "s1.json")
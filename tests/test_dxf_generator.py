@@ -0,0 +1,85 @@
+"""Tests for DXFGenerator output."""
+
+import ezdxf
+import pytest
+
+from src.models import DesignSpec
+from src.models.design_spec import Dimensions, Furniture, Position
+from src.skills.dxf_generator import DXFGenerator, _DEFAULT_FURNITURE_DIMS, _GENERIC_FURNITURE_DIMS
+
+from conftest import room_labels
+
+
+def _point(point):
+    return [round(float(value), 6) + 0.0 for value in tuple(point)[:2]]
+
+
+def _dump(msp):
+    """Entities as comparable rows: type, layer and rounded geometry."""
+    rows = []
+    for entity in msp:
+        kind = entity.dxftype()
+        row = [kind, entity.dxf.layer]
+        if kind == "LINE":
+            row += [_point(entity.dxf.start), _point(entity.dxf.end)]
+        elif kind == "LWPOLYLINE":
+            row += [[_point(p) for p in entity.get_points()], bool(entity.closed)]
+        elif kind == "ARC":
+            row += [_point(entity.dxf.center), round(entity.dxf.radius, 6),
+                    round(entity.dxf.start_angle % 360, 6), round(entity.dxf.end_angle % 360, 6)]
+        elif kind == "TEXT":
+            row += [entity.dxf.text, _point(entity.dxf.insert)]
+        elif kind == "MTEXT":
+            row += [entity.text, _point(entity.dxf.insert)]
+        elif kind == "INSERT":
+            row += [entity.dxf.name, _point(entity.dxf.insert), round(entity.dxf.rotation, 6)]
+        rows.append(row)
+    return rows
+
+
+@pytest.fixture
+def apartment_spec(apartment_spec_dict) -> DesignSpec:
+    return DesignSpec(**apartment_spec_dict)
+
+
+def test_room_workers_do_not_change_the_output(apartment_spec):
+    serial = DXFGenerator()
+    serial.create_floor_plan(apartment_spec, 1)
+    threaded = DXFGenerator(room_workers=4)
+    threaded.create_floor_plan(apartment_spec, 1)
+
+    assert _dump(threaded.msp) == _dump(serial.msp)
+
+
+def test_saved_file_matches_the_document(apartment_spec, tmp_path):
+    generator = DXFGenerator()
+    path = generator.generate_from_spec(apartment_spec, tmp_path / "plan.dxf")
+
+    assert _dump(ezdxf.readfile(path).modelspace()) == _dump(generator.msp)
+    assert room_labels(path) == {room.name for room in apartment_spec.building.floors[0].rooms}
+    assert len(ezdxf.readfile(path).modelspace().query("MTEXT")) == 1
+
+
+@pytest.mark.parametrize("furniture_type", ["bed", "desk", "sofa", "table", "chair"])
+@pytest.mark.parametrize("rotation", [0, 30, 90, 145.5])
+def test_default_furniture_block_matches_the_drawn_rectangle(furniture_type, rotation):
+    width, depth, _ = _DEFAULT_FURNITURE_DIMS.get(furniture_type, _GENERIC_FURNITURE_DIMS)
+    position = Position(x=3.25, y=-1.5, rotation=rotation)
+
+    block_generator = DXFGenerator()
+    block_generator.create_new_document()
+    block_generator.create_furniture(Furniture(type=furniture_type, position=position))
+    (insert,) = block_generator.msp.query("INSERT")
+    (exploded,) = list(insert.virtual_entities())
+
+    drawn_generator = DXFGenerator()
+    drawn_generator.create_new_document()
+    drawn_generator.create_furniture(Furniture(
+        type=furniture_type,
+        position=position,
+        dimensions=Dimensions(width=width, depth=depth)
+    ))
+    (drawn,) = drawn_generator.msp.query("LWPOLYLINE")
+
+    assert exploded.dxf.layer == drawn.dxf.layer == "FURNITURE"
+    assert [_point(p) for p in exploded.get_points()] == [_point(p) for p in drawn.get_points()]
@@ -0,0 +1,74 @@
+"""Tests for the RFC 6902 JSON Patch helper."""
+
+import pytest
+
+from src.utils.json_patch import JsonPatchError, apply_patch
+
+
+@pytest.fixture
+def doc():
+    return {
+        "project": {"name": "Unit", "tags": ["a", "b"]},
+        "rooms": [{"name": "Bedroom"}, {"name": "Kitchen"}],
+        "a/b": 1,
+        "m~n": 2,
+    }
+
+
+def test_apply_patch_does_not_modify_the_original(doc):
+    patched = apply_patch(doc, [{"op": "replace", "path": "/rooms/0/name", "value": "Study"}])
+
+    assert patched["rooms"][0]["name"] == "Study"
+    assert doc["rooms"][0]["name"] == "Bedroom"
+
+
+def test_add_remove_replace(doc):
+    patched = apply_patch(doc, [
+        {"op": "add", "path": "/rooms/-", "value": {"name": "Bath"}},
+        {"op": "add", "path": "/rooms/0", "value": {"name": "Hall"}},
+        {"op": "remove", "path": "/project/tags/0"},
+        {"op": "replace", "path": "/project/name", "value": "House"},
+        {"op": "add", "path": "/project/floors", "value": 2},
+    ])
+
+    assert [room["name"] for room in patched["rooms"]] == ["Hall", "Bedroom", "Kitchen", "Bath"]
+    assert patched["project"] == {"name": "House", "tags": ["b"], "floors": 2}
+
+
+def test_move_copy_test(doc):
+    patched = apply_patch(doc, [
+        {"op": "test", "path": "/rooms/1/name", "value": "Kitchen"},
+        {"op": "copy", "from": "/rooms/0", "path": "/rooms/-"},
+        {"op": "move", "from": "/project/name", "path": "/name"},
+    ])
+
+    assert patched["rooms"][2] == {"name": "Bedroom"}
+    assert patched["rooms"][2] is not patched["rooms"][0]
+    assert patched["name"] == "Unit"
+    assert "name" not in patched["project"]
+
+
+def test_escaped_pointer_tokens(doc):
+    patched = apply_patch(doc, [
+        {"op": "replace", "path": "/a~1b", "value": 10},
+        {"op": "remove", "path": "/m~0n"},
+    ])
+
+    assert patched["a/b"] == 10
+    assert "m~n" not in patched
+
+
+@pytest.mark.parametrize("operation", [
+    {"op": "test", "path": "/project/name", "value": "Other"},
+    {"op": "remove", "path": "/missing"},
+    {"op": "replace", "path": "/rooms/5", "value": {}},
+    {"op": "add", "path": "/rooms/01", "value": {}},
+    {"op": "add", "path": "", "value": {}},
+    {"op": "add", "path": "rooms", "value": {}},
+    {"op": "add", "path": "/project/name/x", "value": 1},
+    {"op": "frobnicate", "path": "/rooms"},
+    {"path": "/rooms"},
+])
+def test_invalid_operations_raise(doc, operation):
+    with pytest.raises(JsonPatchError):
+        apply_patch(doc, [operation])
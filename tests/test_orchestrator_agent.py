@@ -0,0 +1,73 @@
+"""Tests for OrchestratorAgent session and spec bookkeeping (no API calls)."""
+
+import json
+import logging
+
+import pytest
+
+from src.orchestrator import conversation_manager
+from src.orchestrator.conversation_manager import ConversationManager
+from src.orchestrator.orchestrator_agent import OrchestratorAgent
+
+
+@pytest.fixture
+def orchestrator(schema_path, tmp_path):
+    agent = OrchestratorAgent(schema_path, output_dir=tmp_path, api_key="test-key")
+    yield agent
+    agent.close()
+
+
+def _session_files(agent):
+    session_id = agent.conversation.session_id
+    return [
+        path for path in (agent.output_dir / "sessions").iterdir()
+        if path.name in (f"{session_id}.json", f"{session_id}.json.zst")
+    ]
+
+
+def test_save_session_returns_a_future_for_the_write(orchestrator):
+    orchestrator.conversation.add_message("user", "a small study")
+
+    orchestrator.save_session().result(timeout=10)
+
+    (session_file,) = _session_files(orchestrator)
+    loaded = ConversationManager.load_session(session_file)
+    assert [m["content"] for m in loaded.get_message_dicts()] == ["a small study"]
+
+
+def test_save_session_after_close_writes_synchronously(orchestrator):
+    orchestrator.conversation.add_message("user", "a small study")
+    orchestrator.close()
+
+    future = orchestrator.save_session()
+
+    assert future.done()
+    assert len(_session_files(orchestrator)) == 1
+
+
+def test_failed_session_write_is_logged(orchestrator, monkeypatch, caplog):
+    def failing_write(path, payload):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(conversation_manager, "write_bytes", failing_write)
+
+    with caplog.at_level(logging.ERROR):
+        future = orchestrator.save_session()
+        with pytest.raises(OSError):
+            future.result(timeout=10)
+
+    assert "disk full" in caplog.text
+
+
+def test_get_current_spec_returns_a_copy(orchestrator, apartment_spec_dict, tmp_path):
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text(json.dumps(apartment_spec_dict), encoding="utf-8")
+    orchestrator.load_spec_from_file(spec_file)
+
+    spec = orchestrator.get_current_spec()
+    spec["project_info"]["name"] = "Changed"
+    spec["building"]["floors"].clear()
+
+    current = orchestrator.get_current_spec()
+    assert current["project_info"]["name"] == apartment_spec_dict["project_info"]["name"]
+    assert len(current["building"]["floors"]) == 1
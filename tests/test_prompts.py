@@ -0,0 +1,125 @@
+"""Prompt size checks for SpecGenerator.
+
+The baseline prompts are the wording used before the prompts were tightened;
+the current prompts must stay well below them. The offline tests compare
+character counts; the live test compares real token counts and only runs
+when RUN_LIVE_API_TESTS=1 and ANTHROPIC_API_KEY are set.
+"""
+
+import json
+import os
+
+import pytest
+
+from src.orchestrator.spec_generator import SpecGenerator
+
+
+USER_INPUT = "3LDK apartment, about 84 square meters, living room facing south"
+
+BASELINE_SYSTEM_PROMPT = """You are an expert architectural design assistant. Your role is to convert natural language descriptions of buildings and spaces into structured JSON specifications following the DesignSpec schema.
+
+Key responsibilities:
+1. Extract spatial requirements (rooms, dimensions, layout)
+2. Identify design elements (doors, windows, furniture)
+3. Capture project metadata (name, client, requirements)
+4. Generate valid, complete JSON specifications
+5. Ask clarifying questions when requirements are ambiguous
+
+Design principles:
+- All dimensions are in METERS
+- Coordinates use [x, y] format
+- Polygons must be CLOSED (first point == last point)
+- Room types: living_room, bedroom, kitchen, bathroom, etc.
+- Door/window placement uses wall_index (0=bottom, 1=right, 2=top, 3=left)
+
+Always respond with valid JSON that strictly follows the schema. If information is missing, make reasonable assumptions or ask for clarification."""
+
+BASELINE_GENERATION_PROMPT = """Please convert the following architectural design requirements into a valid DesignSpec JSON:
+
+User Requirements:
+{user_input}
+
+Generate a complete DesignSpec JSON that includes:
+1. project_info (name, description, client)
+2. building with floors
+3. Each floor with rooms
+4. Each room with:
+   - geometry (polygon coordinates in meters)
+   - doors (with wall_index and position)
+   - windows (with wall_index, position, dimensions)
+   - furniture (optional)
+
+Important:
+- All coordinates in METERS
+- Polygons MUST be closed (first point == last point)
+- Use realistic dimensions for Korean residential spaces
+- Place doors/windows logically on appropriate walls
+
+Respond with ONLY the JSON, no additional text."""
+
+BASELINE_REFINEMENT_PROMPT = """Here is the current design specification:
+
+{spec}
+
+User Feedback:
+{feedback}
+
+Please update the specification based on this feedback. Maintain all existing data unless specifically requested to change it. Respond with the complete updated JSON."""
+
+FEEDBACK = "Make the master bedroom 1 meter wider"
+
+
+LIVE_API = os.environ.get("RUN_LIVE_API_TESTS") == "1" and bool(os.environ.get("ANTHROPIC_API_KEY"))
+
+
+@pytest.fixture
+def generator(schema_path) -> SpecGenerator:
+    return SpecGenerator(schema_path, api_key="test-key")
+
+
+def _baseline_refinement(spec_dict):
+    return BASELINE_REFINEMENT_PROMPT.format(
+        spec=json.dumps(spec_dict, indent=2, ensure_ascii=False), feedback=FEEDBACK
+    )
+
+
+def test_generation_instructions_are_at_most_half_the_baseline(generator):
+    current = generator._build_system_prompt() + generator._build_generation_prompt(USER_INPUT)
+    baseline = BASELINE_SYSTEM_PROMPT + BASELINE_GENERATION_PROMPT.format(user_input=USER_INPUT)
+
+    assert len(current) <= 0.5 * len(baseline)
+
+
+@pytest.mark.parametrize("delta", [True, False])
+def test_refinement_prompt_is_smaller_than_the_baseline(generator, apartment_spec_dict, delta):
+    current = generator._build_refinement_prompt(apartment_spec_dict, FEEDBACK, delta=delta)
+
+    assert FEEDBACK in current
+    assert len(current) <= 0.6 * len(_baseline_refinement(apartment_spec_dict))
+
+
+@pytest.mark.skipif(not LIVE_API, reason="needs RUN_LIVE_API_TESTS=1 and ANTHROPIC_API_KEY")
+def test_prompt_token_counts_against_the_baseline(schema_path, apartment_spec_dict):
+    generator = SpecGenerator(schema_path)
+
+    def count(system, prompt):
+        return generator.client.messages.count_tokens(
+            model=generator.model,
+            system=system,
+            messages=[{"role": "user", "content": prompt}]
+        ).input_tokens
+
+    current = count(
+        generator._build_system_prompt(), generator._build_generation_prompt(USER_INPUT)
+    )
+    baseline = count(
+        BASELINE_SYSTEM_PROMPT, BASELINE_GENERATION_PROMPT.format(user_input=USER_INPUT)
+    )
+    assert current <= 0.6 * baseline
+
+    current = count(
+        generator._build_system_prompt(),
+        generator._build_refinement_prompt(apartment_spec_dict, FEEDBACK)
+    )
+    baseline = count(BASELINE_SYSTEM_PROMPT, _baseline_refinement(apartment_spec_dict))
+    assert current <= 0.6 * baseline
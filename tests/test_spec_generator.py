@@ -0,0 +1,107 @@
+"""Tests for SpecGenerator (no network access; API calls are not made)."""
+
+import asyncio
+
+import pytest
+
+from src.orchestrator.spec_generator import SpecGenerator
+
+
+@pytest.fixture
+def generator(schema_path) -> SpecGenerator:
+    return SpecGenerator(schema_path, api_key="test-key")
+
+
+def test_async_client_is_per_event_loop(generator):
+    async def clients():
+        return generator.aclient, generator.aclient
+
+    first, same_loop = asyncio.run(clients())
+    second, _ = asyncio.run(clients())
+
+    assert first is same_loop
+    assert first is not second
+
+
+def test_generate_batch_closes_its_loop_client(generator, monkeypatch):
+    used = []
+
+    async def fake_agenerate_batch(user_inputs, context, concurrency, max_tokens):
+        used.append(generator.aclient)
+        return [{"input": user_input} for user_input in user_inputs]
+
+    monkeypatch.setattr(generator, "agenerate_batch", fake_agenerate_batch)
+
+    for _ in range(2):
+        assert generator.generate_batch(["a", "b"], bulk=False) == [{"input": "a"}, {"input": "b"}]
+
+    assert used[0] is not used[1]
+    assert all(client.is_closed() for client in used)
+    assert len(generator._aclients) == 0
+
+
+def test_async_clients_share_one_pool_per_event_loop(schema_path):
+    first = SpecGenerator(schema_path, api_key="test-key")
+    second = SpecGenerator(schema_path, api_key="test-key")
+
+    async def pools():
+        return first.aclient._client, second.aclient._client
+
+    pool_a, pool_b = asyncio.run(pools())
+    pool_c, _ = asyncio.run(pools())
+
+    assert pool_a is pool_b
+    assert pool_a is not pool_c
+
+
+@pytest.mark.parametrize("user_input", [
+    "3LDK apartment with 2 baths",
+    "a two-storey house",
+    "bedroom, kitchen and living room",
+    "거실과 침실 2개",
+])
+def test_multi_room_requests_use_the_main_model(generator, user_input):
+    assert generator._select_model(user_input, None) == generator.model
+
+
+def test_single_room_request_uses_the_simple_model(generator):
+    assert generator._select_model("a small study with a desk", None) == generator.simple_model
+    assert generator._select_model("a small study", {"spec": {}}) == generator.model
+
+
+def test_force_model_overrides_the_automatic_choice(generator, monkeypatch):
+    requested = []
+
+    def fake_stream_json(params):
+        requested.append(params["model"])
+        raise RuntimeError("no network in tests")
+
+    monkeypatch.setattr(generator, "_stream_json", fake_stream_json)
+
+    with pytest.raises(ValueError):
+        generator.generate_from_text("a small study", force_model="custom-model")
+    with pytest.raises(ValueError):
+        generator.generate_from_text("3LDK apartment", force_model=generator.simple_model)
+
+    assert requested == ["custom-model", generator.simple_model]
+
+
+def test_generate_batch_uses_bulk_only_when_asked(generator, monkeypatch):
+    calls = []
+
+    async def fake_agenerate_batch(user_inputs, context, concurrency, max_tokens):
+        calls.append("concurrent")
+        return [{} for _ in user_inputs]
+
+    def fake_generate_bulk(user_inputs, context, max_tokens, timeout=None):
+        calls.append(("bulk", timeout))
+        return [{} for _ in user_inputs]
+
+    monkeypatch.setattr(generator, "agenerate_batch", fake_agenerate_batch)
+    monkeypatch.setattr(generator, "generate_bulk", fake_generate_bulk)
+
+    inputs = ["a small study"] * 50
+    assert len(generator.generate_batch(inputs)) == 50
+    assert len(generator.generate_batch(inputs, bulk=True, bulk_timeout=600)) == 50
+
+    assert calls == ["concurrent", ("bulk", 600)]
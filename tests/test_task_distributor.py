@@ -0,0 +1,74 @@
+"""Tests for TaskDistributor task generation and execution."""
+
+from pathlib import Path
+
+import pytest
+
+from src.orchestrator.task_distributor import AgentType, TaskDistributor, TaskStatus
+
+from conftest import room_labels
+
+
+@pytest.fixture
+def distributor(schema_path, tmp_path) -> TaskDistributor:
+    return TaskDistributor(schema_path, output_dir=tmp_path)
+
+
+def _add(distributor, priority=0, dependencies=None):
+    return distributor.add_task(
+        AgentType.AUTOCAD, "noop", {}, priority=priority, dependencies=dependencies
+    )
+
+
+def test_build_levels_groups_by_dependency_and_sorts_by_priority(distributor):
+    low = _add(distributor, priority=1)
+    high = _add(distributor, priority=5)
+    child = _add(distributor, dependencies=[low.task_id])
+    grandchild = _add(distributor, dependencies=[child.task_id, high.task_id])
+
+    levels = distributor._build_levels(distributor.tasks)
+
+    assert [[task.task_id for task in level] for level in levels] == [
+        [high.task_id, low.task_id],
+        [child.task_id],
+        [grandchild.task_id],
+    ]
+
+
+def test_build_levels_leaves_out_dependency_cycles(distributor):
+    first = _add(distributor)
+    second = _add(distributor, dependencies=[first.task_id])
+    first.dependencies.append(second.task_id)
+    free = _add(distributor)
+
+    levels = distributor._build_levels(distributor.tasks)
+
+    assert [[task.task_id for task in level] for level in levels] == [[free.task_id]]
+
+
+def test_cyclic_and_missing_dependencies_fail_without_running(distributor, monkeypatch):
+    first = _add(distributor)
+    second = _add(distributor, dependencies=[first.task_id])
+    first.dependencies.append(second.task_id)
+    orphan = _add(distributor, dependencies=["task_9999"])
+    monkeypatch.setattr(distributor, "_execute_task", lambda task: pytest.fail("task ran"))
+
+    result = distributor.execute_tasks()
+
+    assert result['failed'] == 3
+    for task in (first, second, orphan):
+        assert task.status == TaskStatus.FAILED
+        assert task.error == "Unmet dependencies"
+
+
+def test_per_floor_tasks_write_only_their_own_floor(two_floor_spec, distributor, tmp_path):
+    distributor.analyze_requirements(two_floor_spec, batch_floors=False)
+
+    result = distributor.execute_tasks()
+
+    assert result['failed'] == 0
+    outputs = {Path(o['result']['output_file']).name: o for o in result['outputs']}
+    assert sorted(outputs) == ["floor_1.dxf", "floor_2.dxf"]
+    for floor in two_floor_spec.building.floors:
+        path = tmp_path / f"floor_{floor.level}.dxf"
+        assert room_labels(path) == {room.name for room in floor.rooms}